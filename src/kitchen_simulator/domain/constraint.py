@@ -25,7 +25,7 @@ CONSTRAINTS = {
     "max_drain_distance": 2.0,   # 배수-세척구역 최대 거리(m)
 }
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintViolation:
     constraint_type: ConstraintType
     message: str
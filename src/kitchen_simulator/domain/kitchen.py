@@ -1,7 +1,7 @@
 """주방 공간 도메인 모델"""
 from enum import Enum
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 class KitchenShape(Enum):
     RECTANGLE = "rectangle"
@@ -25,6 +25,11 @@ class RestaurantType(Enum):
     BAKERY = "bakery"
     OTHER = "other"
 
+    @classmethod
+    def from_value(cls, value: str) -> Optional["RestaurantType"]:
+        """값 문자열 → enum 멤버 (없으면 None, Enum 내부 값 사전으로 O(1) 조회)"""
+        return cls._value2member_map_.get(value)
+
 @dataclass
 class Kitchen:
     shape: KitchenShape
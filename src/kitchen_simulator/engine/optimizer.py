@@ -90,8 +90,8 @@ class Optimizer:
             zone_polys = {z.zone_type: create_polygon(z.polygon) for z in zones}
             placement_polys = placement_engine.get_placement_polygons()
 
-            # 검증
-            validation_engine = ValidationEngine()
+            # 검증 (점수화에는 심각도만 필요하므로 메시지 생략)
+            validation_engine = ValidationEngine(collect_messages=False)
             passed, violations = validation_engine.validate_all(
                 zones, placements.placements, zone_polys, placement_polys,
                 fixed_elements=fixed_elements
@@ -106,7 +106,7 @@ class ScoringEngine:
             if from_zone in zone_centers and to_zone in zone_centers:
                 c1 = zone_centers[from_zone]
                 c2 = zone_centers[to_zone]
-                dist = math.sqrt((c1[0] - c2[0])**2 + (c1[1] - c2[1])**2)
+                dist = math.hypot(c1[0] - c2[0], c1[1] - c2[1])
                 total_distance += dist
 
         # 주방 크기 기반 적응형 점수
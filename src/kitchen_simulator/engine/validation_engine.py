@@ -1,19 +1,42 @@
 """제약 조건 검증 엔진"""
+from functools import lru_cache
+from itertools import combinations
 from typing import List, Dict, Tuple, Optional
-from shapely.geometry import Polygon
+from shapely.geometry import Point, Polygon
+import numpy as np
 
 from ..domain.zone import Zone, ZoneType, ADJACENCY_RULES
-from ..domain.equipment import EquipmentPlacement
+from ..domain.equipment import EquipmentPlacement, EquipmentSpec
 from ..domain.constraint import ConstraintType, ConstraintViolation, CONSTRAINTS
-from ..geometry.polygon import create_polygon, create_rectangle, get_bounds
+from ..geometry.polygon import create_polygon, get_bounds
 from ..geometry.collision import check_aisle_width, get_distance, check_overlap
 from ..data.equipment_catalog import EQUIPMENT_CATALOG
 
+@lru_cache(maxsize=2048)
+def _spec_for(equipment_id: str) -> Optional[EquipmentSpec]:
+    """배치 ID(인덱스 포함)로 카탈로그 스펙 조회 (work_table_medium_0 → work_table_medium)"""
+    return EQUIPMENT_CATALOG.get(equipment_id.rsplit("_", 1)[0])
+
+# 인접 규칙상 서로 인접해야 하는 구역 쌍 (방향 무관)
+_ADJACENT_PAIRS = frozenset(
+    frozenset((zone_type, neighbor))
+    for zone_type, neighbors in ADJACENCY_RULES.items()
+    for neighbor in neighbors
+)
+
 class ValidationEngine:
     """제약 조건 검증 엔진"""
 
-    def __init__(self):
+    def __init__(self, collect_messages: bool = True):
+        """
+        Args:
+            collect_messages: False면 위반 메시지 포맷팅을 생략 (심각도/유형만 필요한 탐색 루프용)
+        """
+        self.collect_messages = collect_messages
         self.violations: List[ConstraintViolation] = []
+        # 구역 폴리곤의 무게중심/경계 캐시 (validate_all 호출마다 초기화)
+        self._zone_centroids: Dict[ZoneType, Tuple[float, float]] = {}
+        self._zone_bounds: Dict[ZoneType, Tuple[float, float, float, float]] = {}
 
     def validate_all(
         self,
@@ -21,44 +44,77 @@ class ValidationEngine:
         placements: List[EquipmentPlacement],
         zone_polys: Dict[ZoneType, Polygon],
         placement_polys: Dict[ZoneType, List[Polygon]],
-        fixed_elements: Optional[List] = None
+        fixed_elements: Optional[List] = None,
+        fast_fail: bool = False
     ) -> Tuple[bool, List[ConstraintViolation]]:
         """모든 제약 조건 검증
 
+        Args:
+            fast_fail: True면 첫 error 발생 즉시 중단 (탐색 루프에서 통과 여부만 필요할 때)
+
         Returns:
             (통과 여부, 위반 목록)
         """
         self.violations = []
+        self._zone_centroids = {}
+        self._zone_bounds = {}
 
-        # 1. 통로 폭 검증
-        self._validate_aisle_widths(zone_polys, placement_polys)
-
-        # 2. 구역 인접성 검증
-        self._validate_zone_adjacency(zones)
+        # 비용이 싸고 error가 자주 나는 검증을 먼저 실행한다.
+        # error를 낼 수 있는 검증(1, 2)이 앞에 있어야 fast_fail이 일찍 종료된다.
 
-        # 3. 장비 충돌 검증
+        # 1. 장비 충돌 검증 (AABB 사전 필터)
         self._validate_equipment_collision(placement_polys)
+        if fast_fail and self._has_errors():
+            return False, self.violations
+
+        # 2. 통로 폭 검증
+        self._validate_aisle_widths(zone_polys, placement_polys)
+        if fast_fail and self._has_errors():
+            return False, self.violations
+
+        # 3. 레인지 인접 간격 검증
+        self._validate_range_spacing(placements, placement_polys)
 
         # 4. 벽 이격 거리 검증
         self._validate_wall_clearance(zone_polys, placement_polys)
 
-        # 5. 인프라 근접성 검증
-        if fixed_elements:
-            self._validate_infrastructure_proximity(zones, zone_polys, fixed_elements)
+        # 5. 구역 간 양방향 통로 검증
+        self._validate_cross_zone_aisles(placement_polys)
 
-        # 6. 레인지 인접 간격 검증
-        self._validate_range_spacing(placements, placement_polys)
+        # 6. 구역 인접성 검증
+        self._validate_zone_adjacency(zones, zone_polys)
 
-        # 7. 구역 간 양방향 통로 검증
-        self._validate_cross_zone_aisles(placement_polys)
+        # 7. 인프라 근접성 검증
+        if fixed_elements:
+            self._validate_infrastructure_proximity(zones, zone_polys, fixed_elements)
 
         # 8. 인프라 요건 경고 (고정 요소 미지정 시)
         if not fixed_elements:
             self._warn_missing_infrastructure(placements)
 
         # 에러만 있으면 실패
-        has_errors = any(v.severity == "error" for v in self.violations)
-        return not has_errors, self.violations
+        return not self._has_errors(), self.violations
+
+    def _violation(
+        self,
+        constraint_type: ConstraintType,
+        message_fmt: str,
+        location: tuple,
+        severity: str = "error",
+        message_args: tuple = (),
+    ) -> ConstraintViolation:
+        """위반 객체 생성 (메시지는 collect_messages일 때만 str.format으로 포맷팅)"""
+        if not self.collect_messages:
+            message = ""
+        elif message_args:
+            message = message_fmt.format(*message_args)
+        else:
+            message = message_fmt
+        return ConstraintViolation(constraint_type, message, location, severity)
+
+    def _has_errors(self) -> bool:
+        """error 심각도 위반 존재 여부"""
+        return any(v.severity == "error" for v in self.violations)
 
     def _validate_aisle_widths(
         self,
@@ -79,56 +135,68 @@ class ValidationEngine:
 
             zone_poly = zone_polys[zone_type]
 
-            # 물리적 최소 간격 위반 검사
-            spacing_violations = check_aisle_width(zone_poly, placements, min_spacing)
-            for location, actual_width in spacing_violations:
-                self.violations.append(ConstraintViolation(
-                    constraint_type=ConstraintType.EQUIPMENT_SPACING,
-                    message=f"장비 간격이 최소 기준({min_spacing*100:.0f}cm)보다 좁습니다 "
-                           f"(실제: {actual_width*100:.0f}cm)",
-                    location=location,
-                    severity="error"
-                ))
-
-            # 통로폭 미달은 info (벽면 라인 배치 시 정상)
-            aisle_violations = check_aisle_width(zone_poly, placements, min_aisle)
-            for location, actual_width in aisle_violations:
-                if actual_width >= min_spacing:
-                    self.violations.append(ConstraintViolation(
+            # 큰 기준으로 한 번만 검사한 뒤 실제 폭으로 분류
+            narrow = check_aisle_width(zone_poly, placements, max(min_spacing, min_aisle))
+            spacing_errors = []
+            aisle_infos = []
+            for location, actual_width in narrow:
+                if actual_width < min_spacing:
+                    # 물리적 최소 간격 위반
+                    spacing_errors.append(self._violation(
+                        constraint_type=ConstraintType.EQUIPMENT_SPACING,
+                        message_fmt="장비 간격이 최소 기준({:.0f}cm)보다 좁습니다 "
+                                    "(실제: {:.0f}cm)",
+                        message_args=(min_spacing * 100, actual_width * 100),
+                        location=location,
+                        severity="error"
+                    ))
+                elif actual_width < min_aisle:
+                    # 통로폭 미달은 info (벽면 라인 배치 시 정상)
+                    aisle_infos.append(self._violation(
                         constraint_type=ConstraintType.AISLE_WIDTH,
-                        message=f"장비 간 통로 폭 {actual_width*100:.0f}cm "
-                               f"(권장: {min_aisle*100:.0f}cm 이상)",
+                        message_fmt="장비 간 통로 폭 {:.0f}cm (권장: {:.0f}cm 이상)",
+                        message_args=(actual_width * 100, min_aisle * 100),
                         location=location,
                         severity="info"
                     ))
 
-    def _validate_zone_adjacency(self, zones: List[Zone]):
+            self.violations.extend(spacing_errors)
+            self.violations.extend(aisle_infos)
+
+    def _validate_zone_adjacency(
+        self,
+        zones: List[Zone],
+        zone_polys: Optional[Dict[ZoneType, Polygon]] = None
+    ):
         """구역 인접성 규칙 검증"""
         zone_by_type = {z.zone_type: z for z in zones}
+        polys = dict(zone_polys) if zone_polys else {}
+
+        def zone_poly_for(zone_type: ZoneType) -> Polygon:
+            if zone_type not in polys:
+                polys[zone_type] = create_polygon(zone_by_type[zone_type].polygon)
+            return polys[zone_type]
 
         for zone_type, required_neighbors in ADJACENCY_RULES.items():
             if zone_type not in zone_by_type:
                 continue
 
-            zone = zone_by_type[zone_type]
-            zone_poly = create_polygon(zone.polygon)
+            zone_poly = zone_poly_for(zone_type)
 
             for required in required_neighbors:
                 if required not in zone_by_type:
                     continue
 
-                neighbor = zone_by_type[required]
-                neighbor_poly = create_polygon(neighbor.polygon)
+                neighbor_poly = zone_poly_for(required)
 
                 # 인접 여부 확인 (접촉 또는 0.5m 이내)
                 distance = get_distance(zone_poly, neighbor_poly)
                 if distance > 0.5:
-                    center = zone_poly.centroid
-                    self.violations.append(ConstraintViolation(
+                    self.violations.append(self._violation(
                         constraint_type=ConstraintType.ZONE_ADJACENCY,
-                        message=f"{zone_type.value} 구역이 {required.value} 구역과 인접하지 않습니다 "
-                               f"(거리: {distance:.1f}m)",
-                        location=(center.x, center.y),
+                        message_fmt="{} 구역이 {} 구역과 인접하지 않습니다 (거리: {:.1f}m)",
+                        message_args=(zone_type.value, required.value, distance),
+                        location=self._get_zone_centroid(zone_type, zone_poly),
                         severity="warning"
                     ))
 
@@ -141,16 +209,26 @@ class ValidationEngine:
         for polys in placement_polys.values():
             all_polys.extend(polys)
 
-        for i in range(len(all_polys)):
-            for j in range(i + 1, len(all_polys)):
-                if check_overlap(all_polys[i], all_polys[j]):
-                    center = all_polys[i].centroid
-                    self.violations.append(ConstraintViolation(
-                        constraint_type=ConstraintType.EQUIPMENT_SPACING,
-                        message="장비가 서로 겹칩니다",
-                        location=(center.x, center.y),
-                        severity="error"
-                    ))
+        if len(all_polys) < 2:
+            return
+
+        # 바운딩 박스가 겹치지 않는 쌍은 Shapely 호출 없이 제외
+        bounds = np.array([p.bounds for p in all_polys], dtype=np.float64)
+        overlap_x = (bounds[:, None, 0] <= bounds[None, :, 2]) & \
+                    (bounds[:, None, 2] >= bounds[None, :, 0])
+        overlap_y = (bounds[:, None, 1] <= bounds[None, :, 3]) & \
+                    (bounds[:, None, 3] >= bounds[None, :, 1])
+        candidates = np.triu(overlap_x & overlap_y, k=1)
+
+        for i, j in zip(*np.nonzero(candidates)):
+            if check_overlap(all_polys[i], all_polys[j]):
+                center = all_polys[i].centroid
+                self.violations.append(self._violation(
+                    constraint_type=ConstraintType.EQUIPMENT_SPACING,
+                    message_fmt="장비가 서로 겹칩니다",
+                    location=(center.x, center.y),
+                    severity="error"
+                ))
 
     def _validate_wall_clearance(
         self,
@@ -164,30 +242,27 @@ class ValidationEngine:
             if zone_type not in zone_polys:
                 continue
 
-            zone_poly = zone_polys[zone_type]
-            zone_bounds = get_bounds(zone_poly)
-
-            for place_poly in placements:
-                minx, miny, maxx, maxy = place_poly.bounds
-
-                # 각 변의 벽 거리 확인
-                distances = [
-                    abs(minx - zone_bounds[0]),  # 좌측
-                    abs(maxx - zone_bounds[2]),  # 우측
-                    abs(miny - zone_bounds[1]),  # 하단
-                    abs(maxy - zone_bounds[3]),  # 상단
-                ]
-
-                for dist in distances:
-                    if 0 < dist < min_clearance:
-                        center = place_poly.centroid
-                        self.violations.append(ConstraintViolation(
-                            constraint_type=ConstraintType.WALL_CLEARANCE,
-                            message=f"벽 이격 거리가 최소 기준({min_clearance*100:.0f}cm)보다 작습니다 "
-                                   f"(실제: {dist*100:.0f}cm)",
-                            location=(center.x, center.y),
-                            severity="warning"
-                        ))
+            if not placements:
+                continue
+
+            zone_bounds = self._get_zone_bounds(zone_type, zone_polys[zone_type])
+
+            # 각 변의 벽 거리 확인 (좌측, 우측, 하단, 상단 순)
+            bounds = np.array([p.bounds for p in placements], dtype=np.float64)
+            ref = np.array([zone_bounds[0], zone_bounds[2], zone_bounds[1], zone_bounds[3]])
+            distances = np.abs(bounds[:, [0, 2, 1, 3]] - ref)
+            mask = (distances > 0) & (distances < min_clearance)
+
+            for idx, edge in zip(*np.nonzero(mask)):
+                dist = float(distances[idx, edge])
+                center = placements[idx].centroid
+                self.violations.append(self._violation(
+                    constraint_type=ConstraintType.WALL_CLEARANCE,
+                    message_fmt="벽 이격 거리가 최소 기준({:.0f}cm)보다 작습니다 (실제: {:.0f}cm)",
+                    message_args=(min_clearance * 100, dist * 100),
+                    location=(center.x, center.y),
+                    severity="warning"
+                ))
 
     def _validate_infrastructure_proximity(
         self,
@@ -196,8 +271,6 @@ class ValidationEngine:
         fixed_elements: List
     ):
         """인프라 설비(환기/급수/배수) 근접성 검증"""
-        from shapely.geometry import Point
-
         # 고정 요소를 유형별로 분류
         vents = [fe for fe in fixed_elements if fe.type == "vent"]
         waters = [fe for fe in fixed_elements if fe.type == "water"]
@@ -207,66 +280,82 @@ class ValidationEngine:
 
         # 환기구 - 조리구역 근접성
         if vents and ZoneType.COOKING in zone_by_type:
-            cooking_poly = zone_polys[ZoneType.COOKING]
-            cooking_center = cooking_poly.centroid
+            cx, cy = self._get_zone_centroid(ZoneType.COOKING, zone_polys[ZoneType.COOKING])
+            cooking_center = Point(cx, cy)
 
             min_dist = min(
                 Point(v.x, v.y).distance(cooking_center) for v in vents
             )
             max_allowed = CONSTRAINTS["max_vent_distance"]
             if min_dist > max_allowed:
-                self.violations.append(ConstraintViolation(
+                self.violations.append(self._violation(
                     constraint_type=ConstraintType.VENTILATION,
-                    message=f"환기구가 조리구역에서 너무 멉니다 "
-                           f"(거리: {min_dist:.1f}m, 기준: {max_allowed:.1f}m)",
-                    location=(cooking_center.x, cooking_center.y),
+                    message_fmt="환기구가 조리구역에서 너무 멉니다 "
+                                "(거리: {:.1f}m, 기준: {:.1f}m)",
+                    message_args=(min_dist, max_allowed),
+                    location=(cx, cy),
                     severity="warning"
                 ))
 
         # 급수 - 세척구역 근접성
         if waters and ZoneType.WASHING in zone_by_type:
-            washing_poly = zone_polys[ZoneType.WASHING]
-            washing_center = washing_poly.centroid
+            cx, cy = self._get_zone_centroid(ZoneType.WASHING, zone_polys[ZoneType.WASHING])
+            washing_center = Point(cx, cy)
 
             min_dist = min(
                 Point(w.x, w.y).distance(washing_center) for w in waters
             )
             max_allowed = CONSTRAINTS["max_water_distance"]
             if min_dist > max_allowed:
-                self.violations.append(ConstraintViolation(
+                self.violations.append(self._violation(
                     constraint_type=ConstraintType.WATER_ACCESS,
-                    message=f"급수 시설이 세척구역에서 너무 멉니다 "
-                           f"(거리: {min_dist:.1f}m, 기준: {max_allowed:.1f}m)",
-                    location=(washing_center.x, washing_center.y),
+                    message_fmt="급수 시설이 세척구역에서 너무 멉니다 "
+                                "(거리: {:.1f}m, 기준: {:.1f}m)",
+                    message_args=(min_dist, max_allowed),
+                    location=(cx, cy),
                     severity="warning"
                 ))
 
         # 배수 - 세척구역 근접성
         if drains and ZoneType.WASHING in zone_by_type:
-            washing_poly = zone_polys[ZoneType.WASHING]
-            washing_center = washing_poly.centroid
+            cx, cy = self._get_zone_centroid(ZoneType.WASHING, zone_polys[ZoneType.WASHING])
+            washing_center = Point(cx, cy)
 
             min_dist = min(
                 Point(d.x, d.y).distance(washing_center) for d in drains
             )
             max_allowed = CONSTRAINTS["max_drain_distance"]
             if min_dist > max_allowed:
-                self.violations.append(ConstraintViolation(
+                self.violations.append(self._violation(
                     constraint_type=ConstraintType.DRAIN_ACCESS,
-                    message=f"배수구가 세척구역에서 너무 멉니다 "
-                           f"(거리: {min_dist:.1f}m, 기준: {max_allowed:.1f}m)",
-                    location=(washing_center.x, washing_center.y),
+                    message_fmt="배수구가 세척구역에서 너무 멉니다 "
+                                "(거리: {:.1f}m, 기준: {:.1f}m)",
+                    message_args=(min_dist, max_allowed),
+                    location=(cx, cy),
                     severity="warning"
                 ))
 
+    def _get_zone_centroid(self, zone_type: ZoneType, zone_poly: Polygon) -> Tuple[float, float]:
+        """구역 무게중심 (검증기 간 공유 캐시)"""
+        if zone_type not in self._zone_centroids:
+            center = zone_poly.centroid
+            self._zone_centroids[zone_type] = (center.x, center.y)
+        return self._zone_centroids[zone_type]
+
+    def _get_zone_bounds(
+        self, zone_type: ZoneType, zone_poly: Polygon
+    ) -> Tuple[float, float, float, float]:
+        """구역 경계 박스 (검증기 간 공유 캐시)"""
+        if zone_type not in self._zone_bounds:
+            self._zone_bounds[zone_type] = get_bounds(zone_poly)
+        return self._zone_bounds[zone_type]
+
     def _validate_range_spacing(
         self,
         placements: List[EquipmentPlacement],
         placement_polys: Dict[ZoneType, List[Polygon]]
     ):
         """레인지(가스레인지/튀김기 등) 인접 간격 검증"""
-        from ..geometry.collision import get_distance as poly_distance
-
         range_spacing = CONSTRAINTS["range_spacing"]
 
         # 조리 구역 장비 중 레인지 류 식별
@@ -278,27 +367,34 @@ class ValidationEngine:
         if len(cooking_placements) < 2 or len(cooking_polys) < 2:
             return
 
-        # 조리 장비 쌍 간 range_spacing 확인
-        for i in range(len(cooking_polys)):
-            equip_id_i = cooking_placements[i].equipment_id.rsplit("_", 1)[0]
-            spec_i = EQUIPMENT_CATALOG.get(equip_id_i)
-            if not spec_i or spec_i.clearance_sides < range_spacing:
-                continue
+        # 장비별 스펙을 한 번만 조회 (쌍 루프 안에서 반복 조회하지 않도록)
+        specs = [_spec_for(p.equipment_id) for p in cooking_placements]
+        n = min(len(specs), len(cooking_polys))
+
+        # 측면 이격이 range_spacing 이상인 장비만 기준 장비 후보
+        candidates = [
+            i for i in range(n)
+            if specs[i] and specs[i].clearance_sides >= range_spacing
+        ]
 
-            for j in range(i + 1, len(cooking_polys)):
-                equip_id_j = cooking_placements[j].equipment_id.rsplit("_", 1)[0]
-                spec_j = EQUIPMENT_CATALOG.get(equip_id_j)
+        # 조리 장비 쌍 간 range_spacing 확인
+        for i in candidates:
+            spec_i = specs[i]
+            for j in range(i + 1, n):
+                spec_j = specs[j]
                 if not spec_j:
                     continue
 
                 dist = cooking_polys[i].distance(cooking_polys[j])
                 if 0 < dist < range_spacing:
                     center = cooking_polys[i].centroid
-                    self.violations.append(ConstraintViolation(
+                    self.violations.append(self._violation(
                         constraint_type=ConstraintType.RANGE_SPACING,
-                        message=f"{spec_i.name_ko}↔{spec_j.name_ko} 인접 간격이 "
-                               f"기준({range_spacing*100:.0f}cm)보다 좁습니다 "
-                               f"(실제: {dist*100:.0f}cm)",
+                        message_fmt="{}↔{} 인접 간격이 기준({:.0f}cm)보다 좁습니다 "
+                                    "(실제: {:.0f}cm)",
+                        message_args=(
+                            spec_i.name_ko, spec_j.name_ko, range_spacing * 100, dist * 100
+                        ),
                         location=(center.x, center.y),
                         severity="warning"
                     ))
@@ -308,100 +404,97 @@ class ValidationEngine:
         placement_polys: Dict[ZoneType, List[Polygon]]
     ):
         """구역 간 양방향 통로 폭 검증"""
-        from ..domain.zone import ADJACENCY_RULES
         min_double = CONSTRAINTS["min_aisle_double"]
 
-        zone_types = list(placement_polys.keys())
-        checked = set()
-
-        for zt1 in zone_types:
-            for zt2 in zone_types:
-                if zt1 == zt2:
-                    continue
-                pair = (min(zt1.value, zt2.value), max(zt1.value, zt2.value))
-                if pair in checked:
-                    continue
-                checked.add(pair)
-
-                # 인접 구역 간만 검증
-                if zt2 not in ADJACENCY_RULES.get(zt1, []) and \
-                   zt1 not in ADJACENCY_RULES.get(zt2, []):
-                    continue
+        for zt1, zt2 in combinations(placement_polys.keys(), 2):
+            # 인접 구역 간만 검증
+            if frozenset((zt1, zt2)) not in _ADJACENT_PAIRS:
+                continue
 
-                for p1 in placement_polys[zt1]:
-                    for p2 in placement_polys[zt2]:
-                        dist = p1.distance(p2)
-                        if 0 < dist < min_double:
-                            c1 = p1.centroid
-                            c2 = p2.centroid
-                            mid = ((c1.x + c2.x) / 2, (c1.y + c2.y) / 2)
-                            self.violations.append(ConstraintViolation(
-                                constraint_type=ConstraintType.AISLE_WIDTH,
-                                message=f"구역 간 통로 폭이 양방향 기준({min_double*100:.0f}cm)보다 "
-                                       f"좁습니다 (실제: {dist*100:.0f}cm)",
-                                location=mid,
-                                severity="warning"
-                            ))
+            for p1 in placement_polys[zt1]:
+                for p2 in placement_polys[zt2]:
+                    dist = p1.distance(p2)
+                    if 0 < dist < min_double:
+                        c1 = p1.centroid
+                        c2 = p2.centroid
+                        mid = ((c1.x + c2.x) / 2, (c1.y + c2.y) / 2)
+                        self.violations.append(self._violation(
+                            constraint_type=ConstraintType.AISLE_WIDTH,
+                            message_fmt="구역 간 통로 폭이 양방향 기준({:.0f}cm)보다 "
+                                        "좁습니다 (실제: {:.0f}cm)",
+                            message_args=(min_double * 100, dist * 100),
+                            location=mid,
+                            severity="warning"
+                        ))
 
     def _warn_missing_infrastructure(
         self,
         placements: List[EquipmentPlacement]
     ):
         """인프라 요건 경고 (고정 요소 미지정 시)"""
-        needs_vent = []
-        needs_water = []
-        needs_drain = []
+        # 이름 중복 제거용 dict (값은 사용하지 않음)
+        needs_vent: Dict[str, None] = {}
+        needs_water: Dict[str, None] = {}
+        needs_drain: Dict[str, None] = {}
 
         for p in placements:
-            equip_id = p.equipment_id.rsplit("_", 1)[0]
-            spec = EQUIPMENT_CATALOG.get(equip_id)
+            spec = _spec_for(p.equipment_id)
             if not spec:
                 continue
 
             if spec.requires_ventilation:
-                needs_vent.append(spec.name_ko)
+                needs_vent[spec.name_ko] = None
             if spec.requires_water:
-                needs_water.append(spec.name_ko)
+                needs_water[spec.name_ko] = None
             if spec.requires_drain:
-                needs_drain.append(spec.name_ko)
+                needs_drain[spec.name_ko] = None
 
         if needs_vent:
-            names = ", ".join(sorted(set(needs_vent)))
-            self.violations.append(ConstraintViolation(
+            names = ", ".join(sorted(needs_vent))
+            self.violations.append(self._violation(
                 constraint_type=ConstraintType.VENTILATION,
-                message=f"환기 시설 필요 장비: {names} (고정 요소 미지정)",
+                message_fmt="환기 시설 필요 장비: {} (고정 요소 미지정)",
+                message_args=(names,),
                 location=(0, 0),
                 severity="info"
             ))
         if needs_water:
-            names = ", ".join(sorted(set(needs_water)))
-            self.violations.append(ConstraintViolation(
+            names = ", ".join(sorted(needs_water))
+            self.violations.append(self._violation(
                 constraint_type=ConstraintType.WATER_ACCESS,
-                message=f"급수 시설 필요 장비: {names} (고정 요소 미지정)",
+                message_fmt="급수 시설 필요 장비: {} (고정 요소 미지정)",
+                message_args=(names,),
                 location=(0, 0),
                 severity="info"
             ))
         if needs_drain:
-            names = ", ".join(sorted(set(needs_drain)))
-            self.violations.append(ConstraintViolation(
+            names = ", ".join(sorted(needs_drain))
+            self.violations.append(self._violation(
                 constraint_type=ConstraintType.DRAIN_ACCESS,
-                message=f"배수 시설 필요 장비: {names} (고정 요소 미지정)",
+                message_fmt="배수 시설 필요 장비: {} (고정 요소 미지정)",
+                message_args=(names,),
                 location=(0, 0),
                 severity="info"
             ))
 
     def get_summary(self) -> Dict:
         """검증 결과 요약"""
-        errors = [v for v in self.violations if v.severity == "error"]
-        warnings = [v for v in self.violations if v.severity == "warning"]
-        infos = [v for v in self.violations if v.severity == "info"]
+        # 심각도별 메시지를 한 번의 순회로 분류
+        errors, warnings, infos = [], [], []
+        for v in self.violations:
+            if v.severity == "error":
+                errors.append(v.message)
+            elif v.severity == "warning":
+                warnings.append(v.message)
+            elif v.severity == "info":
+                infos.append(v.message)
 
         return {
             "passed": len(errors) == 0,
             "error_count": len(errors),
             "warning_count": len(warnings),
             "info_count": len(infos),
-            "errors": [v.message for v in errors],
-            "warnings": [v.message for v in warnings],
-            "infos": [v.message for v in infos],
+            "errors": errors,
+            "warnings": warnings,
+            "infos": infos,
         }
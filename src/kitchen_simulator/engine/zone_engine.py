@@ -98,12 +98,13 @@ class ZoneEngine:
     def get_zone_summary(self, zones: List[Zone], kitchen: Kitchen) -> Dict:
         """구역 분할 요약 정보"""
         total_area = kitchen.area
+        inv_total = 1.0 / total_area if total_area > 0 else 0.0
         return {
             "total_area_sqm": total_area,
             "zones": {
                 zone.zone_type.value: {
                     "area_sqm": round(zone.area, 2),
-                    "ratio": round(zone.area / total_area, 3) if total_area > 0 else 0,
+                    "ratio": round(zone.area * inv_total, 3),
                 }
                 for zone in zones
             }
@@ -1,6 +1,12 @@
 """C5 평가 엔진 - 생성 결과와 실데이터 비교"""
+import bisect
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from .models import (
     CaseComparison,
     EvaluationReport,
@@ -8,13 +14,18 @@ from .models import (
     SimilarityMetrics,
 )
 from .metrics import (
+    build_vocab,
     category_distribution_from_equipment,
-    category_distribution_from_generated,
-    cosine_similarity,
+    category_vector,
+    cosine_against_rows,
+    cosine_similarity_precomp,
     count_accuracy,
     equipment_names_from_generated,
     equipment_names_from_real,
-    jaccard_similarity,
+    generated_category_vector,
+    jaccard_from_masks,
+    name_mask,
+    vector_norm,
     zone_ratio_from_zones,
 )
 from ..generator.models import GenerationResult
@@ -44,12 +55,89 @@ GRADE_THRESHOLDS = {
     "D": 0,
 }
 
+# 등급 이분 탐색용 (기준 오름차순)
+_GRADE_CUTOFFS = sorted(GRADE_THRESHOLDS.items(), key=lambda item: item[1])
+_GRADE_SCORES = [threshold for _, threshold in _GRADE_CUTOFFS]
+_GRADE_NAMES = [grade for grade, _ in _GRADE_CUTOFFS]
+
+
+def _grade_for(score: float) -> str:
+    """최종 점수 → 등급 (최하 기준 미만도 최하 등급)"""
+    idx = bisect.bisect_right(_GRADE_SCORES, score) - 1
+    return _GRADE_NAMES[max(idx, 0)]
+
+
+# 워커 프로세스별 평가기 (프로세스당 데이터셋 1회 로드)
+_worker_evaluator: Optional["Evaluator"] = None
+
+
+def _evaluate_in_worker(item: tuple) -> EvaluationResult:
+    """프로세스 풀 워커 - (GenerationResult, layout_score) 단건 평가"""
+    global _worker_evaluator
+    if _worker_evaluator is None:
+        _worker_evaluator = Evaluator()
+    gen_result, layout_score = item
+    return _worker_evaluator.evaluate(gen_result, layout_score)
+
+
+@dataclass(slots=True)
+class _CaseFeatures:
+    """실 사례 비교 특성 (불변 데이터셋에서 1회 계산)"""
+    cat_vec: np.ndarray        # 카테고리 분포 벡터 (Evaluator 카테고리 어휘 기준)
+    cat_norm: float            # cat_vec 크기
+    names: set                 # 장비명 세트
+    name_mask: int             # 장비명 비트셋 (Evaluator 장비명 어휘 기준)
+    zone_dist: Dict[str, float]  # 구역 비율
+    zone_norm: float           # zone_dist 크기
+
 
 class Evaluator:
     """생성 결과 평가기"""
 
     def __init__(self):
         self.retriever = CaseRetriever()
+        cases = self.retriever.cases
+        # 비교 벡터/비트셋 어휘는 참조 사례로 고정 (생성 결과의 새 이름은 호출 단위로만 처리)
+        self._category_vocab = build_vocab(
+            eq.get("category") or "other"
+            for case in cases for eq in case.get("equipment_list", [])
+        )
+        self._name_vocab = build_vocab(
+            name for case in cases
+            for name in equipment_names_from_real(case.get("equipment_list", []))
+        )
+        # 실 사례별 비교 특성 사전 계산 (데이터셋 불변 → 로드 시 1회)
+        self._case_features: Dict[int, _CaseFeatures] = {
+            case["basic_info"]["case_number"]: self._extract_case_features(case)
+            for case in cases
+        }
+
+    def _extract_case_features(
+        self,
+        case: dict,
+        local_categories: Optional[Dict[str, int]] = None,
+        local_names: Optional[Dict[str, int]] = None,
+    ) -> "_CaseFeatures":
+        """실 사례의 비교용 특성 추출
+
+        Args:
+            local_categories, local_names: 어휘에 없는 키의 호출 단위 ID 사전
+        """
+        real_equipment = case.get("equipment_list", [])
+        real_names = equipment_names_from_real(real_equipment)
+        cat_vec = category_vector(
+            category_distribution_from_equipment(real_equipment),
+            self._category_vocab, local_categories,
+        )
+        zone_dist = zone_ratio_from_zones(case.get("zones", []))
+        return _CaseFeatures(
+            cat_vec=cat_vec,
+            cat_norm=float(np.linalg.norm(cat_vec)),
+            names=real_names,
+            name_mask=name_mask(real_names, self._name_vocab, local_names),
+            zone_dist=zone_dist,
+            zone_norm=vector_norm(zone_dist),
+        )
 
     def evaluate(
         self,
@@ -76,15 +164,13 @@ class Evaluator:
                 top_k=compare_top_k,
             )
 
-        # 각 유사 사례와 비교
-        comparisons = []
+        # 유사 사례 전체와 일괄 비교
+        real_cases = []
         for sc in similar_cases[:compare_top_k]:
             original = self.retriever._find_case(sc.case_number)
-            if not original:
-                continue
-
-            comp = self._compare_with_case(gen_result, original)
-            comparisons.append(comp)
+            if original:
+                real_cases.append(original)
+        comparisons = self._compare_batch(gen_result, real_cases)
 
         # 평균 유사도 계산
         avg_sim = self._average_metrics(comparisons)
@@ -95,11 +181,7 @@ class Evaluator:
         final = sim_score * FINAL_WEIGHTS["similarity"] + layout * FINAL_WEIGHTS["layout"]
 
         # 등급 결정
-        grade = "D"
-        for g, threshold in GRADE_THRESHOLDS.items():
-            if final >= threshold:
-                grade = g
-                break
+        grade = _grade_for(final)
 
         return EvaluationResult(
             business_type=gen_result.business_type,
@@ -114,12 +196,24 @@ class Evaluator:
     def evaluate_batch(
         self,
         results: List[tuple],  # List[(GenerationResult, layout_score)]
+        n_workers: int = 1,
     ) -> EvaluationReport:
-        """다중 생성 결과 일괄 평가"""
-        evaluations = []
-        for gen_result, layout_score in results:
-            ev = self.evaluate(gen_result, layout_score)
-            evaluations.append(ev)
+        """다중 생성 결과 일괄 평가
+
+        Args:
+            results: (GenerationResult, layout_score) 리스트
+            n_workers: 병렬 평가 프로세스 수 (1이면 순차 평가)
+        """
+        if n_workers > 1 and len(results) > 1:
+            # 각 평가는 독립적이므로 프로세스 풀로 분산 (입력 순서 유지)
+            chunksize = math.ceil(len(results) / n_workers)
+            with ProcessPoolExecutor(n_workers) as ex:
+                evaluations = list(ex.map(_evaluate_in_worker, results, chunksize=chunksize))
+        else:
+            evaluations = []
+            for gen_result, layout_score in results:
+                ev = self.evaluate(gen_result, layout_score)
+                evaluations.append(ev)
 
         if not evaluations:
             return EvaluationReport(
@@ -129,36 +223,41 @@ class Evaluator:
                 avg_layout_score=0,
             )
 
-        # 집계
-        avg_final = sum(e.final_score for e in evaluations) / len(evaluations)
-        avg_sim = sum(e.avg_similarity.overall_similarity for e in evaluations) / len(evaluations)
-        avg_layout = sum(
-            (e.layout_score or 0) for e in evaluations
-        ) / len(evaluations)
-
-        # 등급 분포
+        # 집계 (단일 패스: 전체 합계, 등급 분포, 업종별 합계)
+        final_sum = sim_sum = layout_sum = 0.0
         grade_dist = {}
+        # 업종 → [유사도 합, 배치점수 합, 최종점수 합, 건수]
+        biz_sums: Dict[str, list] = {}
         for e in evaluations:
+            sim = e.avg_similarity.overall_similarity
+            layout = e.layout_score or 0
+            final_sum += e.final_score
+            sim_sum += sim
+            layout_sum += layout
+
             grade_dist[e.grade] = grade_dist.get(e.grade, 0) + 1
 
-        # 업종별 성능
-        by_biz: Dict[str, List[EvaluationResult]] = {}
-        for e in evaluations:
-            by_biz.setdefault(e.business_type, []).append(e)
+            acc = biz_sums.get(e.business_type)
+            if acc is None:
+                acc = biz_sums[e.business_type] = [0.0, 0.0, 0.0, 0]
+            acc[0] += sim
+            acc[1] += layout
+            acc[2] += e.final_score
+            acc[3] += 1
 
+        n = len(evaluations)
+        avg_final = final_sum / n
+        avg_sim = sim_sum / n
+        avg_layout = layout_sum / n
+
+        # 업종별 성능
         biz_summary = {}
-        for biz, evs in by_biz.items():
+        for biz, (biz_sim, biz_layout, biz_final, count) in biz_sums.items():
             biz_summary[biz] = {
-                "avg_similarity": round(
-                    sum(e.avg_similarity.overall_similarity for e in evs) / len(evs), 1
-                ),
-                "avg_layout_score": round(
-                    sum((e.layout_score or 0) for e in evs) / len(evs), 1
-                ),
-                "avg_final_score": round(
-                    sum(e.final_score for e in evs) / len(evs), 1
-                ),
-                "count": len(evs),
+                "avg_similarity": round(biz_sim / count, 1),
+                "avg_layout_score": round(biz_layout / count, 1),
+                "avg_final_score": round(biz_final / count, 1),
+                "count": count,
             }
 
         return EvaluationReport(
@@ -171,70 +270,97 @@ class Evaluator:
             by_business_type=biz_summary,
         )
 
-    def _compare_with_case(
+    def _compare_batch(
         self,
         gen_result: GenerationResult,
-        real_case: dict,
-    ) -> CaseComparison:
-        """생성 결과와 실 사례 비교"""
-        basic = real_case.get("basic_info", {})
-        real_equipment = real_case.get("equipment_list", [])
-        real_zones = real_case.get("zones", [])
-
-        # 1. 카테고리 분포 유사도
-        gen_cat_dist = category_distribution_from_generated(
-            gen_result.generated_equipment
+        real_cases: List[dict],
+    ) -> List[CaseComparison]:
+        """생성 결과와 여러 실 사례 일괄 비교
+
+        생성 측 특성(카테고리 벡터, 장비명, 구역 크기)은 1회만 계산하고
+        카테고리 코사인은 (K, V) 행렬 곱 한 번으로 구한다.
+        """
+        if not real_cases:
+            return []
+
+        # 어휘에 없는 카테고리/장비명의 이번 호출 한정 ID (양쪽이 같은 ID를 쓰도록 공유)
+        local_categories: Dict[str, int] = {}
+        local_names: Dict[str, int] = {}
+
+        features_list = []
+        for real_case in real_cases:
+            features = self._case_features.get(
+                real_case.get("basic_info", {}).get("case_number")
+            )
+            if features is None:
+                features = self._extract_case_features(
+                    real_case, local_categories, local_names
+                )
+            features_list.append(features)
+
+        # 1. 카테고리 분포 유사도 (일괄)
+        gen_cat_vec = generated_category_vector(
+            gen_result.generated_equipment, self._category_vocab, local_categories
+        )
+        cat_sims = cosine_against_rows(
+            gen_cat_vec,
+            [f.cat_vec for f in features_list],
+            np.array([f.cat_norm for f in features_list]),
         )
-        real_cat_dist = category_distribution_from_equipment(real_equipment)
-        cat_sim = cosine_similarity(gen_cat_dist, real_cat_dist)
 
-        # 2. 장비명 겹침 (Jaccard)
         gen_names = equipment_names_from_generated(gen_result.generated_equipment)
-        real_names = equipment_names_from_real(real_equipment)
-        name_overlap = jaccard_similarity(gen_names, real_names)
-
-        # 3. 장비 수 정확도
+        gen_mask = name_mask(gen_names, self._name_vocab, local_names)
         gen_count = len(gen_result.generated_equipment)
-        real_count = len(real_equipment)
-        count_acc = count_accuracy(gen_count, real_count)
-
-        # 4. 구역 비율 유사도
-        real_zone_dist = zone_ratio_from_zones(real_zones)
-        zone_sim = cosine_similarity(
-            gen_result.recommended_zone_ratios,
-            real_zone_dist,
-        ) if real_zone_dist else 0.5  # 구역 데이터 없으면 기본값
-
-        # 종합 유사도
-        overall = (
-            cat_sim * SIMILARITY_WEIGHTS["equipment_category"]
-            + name_overlap * SIMILARITY_WEIGHTS["equipment_name"]
-            + count_acc * SIMILARITY_WEIGHTS["equipment_count"]
-            + zone_sim * SIMILARITY_WEIGHTS["zone_ratio"]
-        ) * 100
-
-        metrics = SimilarityMetrics(
-            equipment_category_similarity=round(cat_sim, 3),
-            equipment_name_overlap=round(name_overlap, 3),
-            equipment_count_accuracy=round(count_acc, 3),
-            zone_ratio_similarity=round(zone_sim, 3),
-            overall_similarity=round(overall, 1),
-        )
+        gen_zone = gen_result.recommended_zone_ratios
 
-        # 매칭/미싱/추가 장비
-        matched = sorted(gen_names & real_names)
-        missing = sorted(real_names - gen_names)
-        extra = sorted(gen_names - real_names)
-
-        return CaseComparison(
-            case_number=basic.get("case_number", 0),
-            business_type=basic.get("business_type_category", "unknown"),
-            kitchen_area_py=basic.get("kitchen_area_py"),
-            similarity_metrics=metrics,
-            matched_equipment=matched,
-            missing_equipment=missing,
-            extra_equipment=extra,
-        )
+        comparisons = []
+        for real_case, features, cat_sim in zip(real_cases, features_list, cat_sims):
+            basic = real_case.get("basic_info", {})
+            real_names = features.names
+            cat_sim = float(cat_sim)
+
+            # 2. 장비명 겹침 (Jaccard)
+            name_overlap = jaccard_from_masks(gen_mask, features.name_mask)
+
+            # 3. 장비 수 정확도
+            real_count = len(real_case.get("equipment_list", []))
+            count_acc = count_accuracy(gen_count, real_count)
+
+            # 4. 구역 비율 유사도
+            zone_sim = cosine_similarity_precomp(
+                gen_zone,
+                features.zone_dist,
+                features.zone_norm,
+            ) if features.zone_dist else 0.5  # 구역 데이터 없으면 기본값
+
+            # 종합 유사도
+            overall = (
+                cat_sim * SIMILARITY_WEIGHTS["equipment_category"]
+                + name_overlap * SIMILARITY_WEIGHTS["equipment_name"]
+                + count_acc * SIMILARITY_WEIGHTS["equipment_count"]
+                + zone_sim * SIMILARITY_WEIGHTS["zone_ratio"]
+            ) * 100
+
+            metrics = SimilarityMetrics(
+                equipment_category_similarity=cat_sim,
+                equipment_name_overlap=name_overlap,
+                equipment_count_accuracy=count_acc,
+                zone_ratio_similarity=zone_sim,
+                overall_similarity=overall,
+            )
+
+            # 매칭/미싱/추가 장비
+            comparisons.append(CaseComparison(
+                case_number=basic.get("case_number", 0),
+                business_type=basic.get("business_type_category", "unknown"),
+                kitchen_area_py=basic.get("kitchen_area_py"),
+                similarity_metrics=metrics,
+                matched_equipment=sorted(gen_names & real_names),
+                missing_equipment=sorted(real_names - gen_names),
+                extra_equipment=sorted(gen_names - real_names),
+            ))
+
+        return comparisons
 
     def _average_metrics(
         self, comparisons: List[CaseComparison]
@@ -242,28 +368,28 @@ class Evaluator:
         """비교 결과들의 평균 지표"""
         if not comparisons:
             return SimilarityMetrics(
-                equipment_category_similarity=0,
-                equipment_name_overlap=0,
-                equipment_count_accuracy=0,
-                zone_ratio_similarity=0,
-                overall_similarity=0,
+                equipment_category_similarity=0.0,
+                equipment_name_overlap=0.0,
+                equipment_count_accuracy=0.0,
+                zone_ratio_similarity=0.0,
+                overall_similarity=0.0,
             )
 
+        # 단일 패스 누적
+        cat_sum = name_sum = count_sum = zone_sum = overall_sum = 0.0
+        for c in comparisons:
+            m = c.similarity_metrics
+            cat_sum += m.equipment_category_similarity
+            name_sum += m.equipment_name_overlap
+            count_sum += m.equipment_count_accuracy
+            zone_sum += m.zone_ratio_similarity
+            overall_sum += m.overall_similarity
+
         n = len(comparisons)
         return SimilarityMetrics(
-            equipment_category_similarity=round(
-                sum(c.similarity_metrics.equipment_category_similarity for c in comparisons) / n, 3
-            ),
-            equipment_name_overlap=round(
-                sum(c.similarity_metrics.equipment_name_overlap for c in comparisons) / n, 3
-            ),
-            equipment_count_accuracy=round(
-                sum(c.similarity_metrics.equipment_count_accuracy for c in comparisons) / n, 3
-            ),
-            zone_ratio_similarity=round(
-                sum(c.similarity_metrics.zone_ratio_similarity for c in comparisons) / n, 3
-            ),
-            overall_similarity=round(
-                sum(c.similarity_metrics.overall_similarity for c in comparisons) / n, 1
-            ),
+            equipment_category_similarity=cat_sum / n,
+            equipment_name_overlap=name_sum / n,
+            equipment_count_accuracy=count_sum / n,
+            zone_ratio_similarity=zone_sum / n,
+            overall_similarity=overall_sum / n,
         )
@@ -1,18 +1,26 @@
 """유사도 계산 함수들"""
 import math
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from collections import Counter
 
+import numpy as np
 
-def cosine_similarity(vec_a: Dict[str, float], vec_b: Dict[str, float]) -> float:
-    """두 딕셔너리 벡터의 코사인 유사도 (0~1)"""
-    all_keys = set(vec_a.keys()) | set(vec_b.keys())
-    if not all_keys:
+
+def vector_norm(vec: Dict[str, float]) -> float:
+    """딕셔너리 벡터의 크기 (L2 노름)"""
+    return math.sqrt(sum(v ** 2 for v in vec.values()))
+
+
+def cosine_similarity_precomp(
+    vec_a: Dict[str, float], vec_b: Dict[str, float], mag_b: float
+) -> float:
+    """두 딕셔너리 벡터의 코사인 유사도 (0~1, vec_b 크기는 vector_norm으로 미리 계산)"""
+    if not vec_a and not vec_b:
         return 0.0
 
-    dot = sum(vec_a.get(k, 0) * vec_b.get(k, 0) for k in all_keys)
-    mag_a = math.sqrt(sum(v ** 2 for v in vec_a.values()))
-    mag_b = math.sqrt(sum(v ** 2 for v in vec_b.values()))
+    # vec_a에 없는 키는 내적에 기여하지 않음
+    dot = sum(v * vec_b.get(k, 0) for k, v in vec_a.items())
+    mag_a = vector_norm(vec_a)
 
     if mag_a == 0 or mag_b == 0:
         return 0.0
@@ -20,16 +28,104 @@ def cosine_similarity(vec_a: Dict[str, float], vec_b: Dict[str, float]) -> float
     return dot / (mag_a * mag_b)
 
 
-def jaccard_similarity(set_a: set, set_b: set) -> float:
-    """자카드 유사도 (0~1)"""
-    if not set_a and not set_b:
+def generated_category_vector(
+    equipment_list: List,  # List[GeneratedEquipment]
+    vocab: Dict[str, int],
+    local: Optional[Dict[str, int]] = None,
+) -> np.ndarray:
+    """GeneratedEquipment 리스트 → 카테고리 분포 밀집 벡터 (중간 딕셔너리 없음)
+
+    어휘에 없는 카테고리는 local에 호출 단위 ID를 부여한다 (vocab_index 참고).
+    장비가 없으면(수량 합 0) 0 벡터
+    """
+    if local is None:
+        local = {}
+    ids = [vocab_index(eq.category, vocab, local) for eq in equipment_list]
+    gen_vec = np.zeros(len(vocab) + len(local))
+    for idx, eq in zip(ids, equipment_list):
+        gen_vec[idx] += eq.quantity
+
+    total = gen_vec.sum()
+    if total == 0:
+        return gen_vec
+    return gen_vec / total
+
+
+def cosine_against_rows(
+    vec: np.ndarray, rows: List[np.ndarray], row_norms: np.ndarray
+) -> np.ndarray:
+    """밀집 벡터 하나와 여러 벡터의 코사인 유사도 일괄 계산
+
+    길이가 다른 벡터(호출 단위 ID 포함 여부)는 0으로 채워 (K, V) 행렬로 쌓는다
+    """
+    width = max([len(vec)] + [len(r) for r in rows])
+    mat = np.zeros((len(rows), width))
+    for i, row in enumerate(rows):
+        mat[i, :len(row)] = row
+    padded = np.zeros(width)
+    padded[:len(vec)] = vec
+
+    dots = mat @ padded
+    denom = row_norms * float(np.linalg.norm(vec))
+    # 내적이 0이면 0 (크기 0 벡터 포함)
+    return np.divide(dots, denom, out=np.zeros(len(rows)), where=dots != 0)
+
+
+def build_vocab(keys: Iterable[str]) -> Dict[str, int]:
+    """키 → 정수 ID 어휘 (최초 등장 순)"""
+    vocab: Dict[str, int] = {}
+    for key in keys:
+        vocab.setdefault(key, len(vocab))
+    return vocab
+
+
+def vocab_index(key: str, vocab: Dict[str, int], local: Dict[str, int]) -> int:
+    """어휘 ID 조회 - 어휘에 없는 키는 local에 len(vocab)부터 ID 부여
+
+    어휘(참조 사례 기준)는 고정하고, 처음 보는 키는 호출 단위 local 사전에만
+    추가하므로 프로세스 수명 동안 어휘가 계속 커지지 않는다.
+    """
+    idx = vocab.get(key)
+    if idx is None:
+        idx = local.setdefault(key, len(vocab) + len(local))
+    return idx
+
+
+def category_vector(
+    distribution: Dict[str, float],
+    vocab: Dict[str, int],
+    local: Optional[Dict[str, int]] = None,
+) -> np.ndarray:
+    """카테고리 분포 딕셔너리 → 밀집 벡터 (vocab 기준)"""
+    if local is None:
+        local = {}
+    ids = [vocab_index(cat, vocab, local) for cat in distribution]
+    vec = np.zeros(len(vocab) + len(local))
+    vec[ids] = list(distribution.values())
+    return vec
+
+
+def jaccard_from_masks(mask_a: int, mask_b: int) -> float:
+    """비트셋(정수) 자카드 유사도 (0~1, 둘 다 비어 있으면 1)"""
+    if not mask_a and not mask_b:
         return 1.0
-    if not set_a or not set_b:
+    if not mask_a or not mask_b:
         return 0.0
-
-    intersection = set_a & set_b
-    union = set_a | set_b
-    return len(intersection) / len(union)
+    return (mask_a & mask_b).bit_count() / (mask_a | mask_b).bit_count()
+
+
+def name_mask(
+    names: set,
+    vocab: Dict[str, int],
+    local: Optional[Dict[str, int]] = None,
+) -> int:
+    """장비명 세트 → vocab 기준 비트셋 (어휘에 없는 이름은 local 비트 사용)"""
+    if local is None:
+        local = {}
+    mask = 0
+    for name in names:
+        mask |= 1 << vocab_index(name, vocab, local)
+    return mask
 
 
 def count_accuracy(generated_count: int, real_count: int) -> float:
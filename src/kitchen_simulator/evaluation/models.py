@@ -1,42 +1,44 @@
 """C5 평가 결과 데이터 모델"""
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field, replace
+from pydantic import BaseModel, Field, field_serializer
 from typing import Dict, List, Optional
 
 
-class SimilarityMetrics(BaseModel):
+# 비교 1건마다 생성되는 내부 지표는 검증 없는 slots 데이터클래스로 둔다
+# (API 경계인 EvaluationResult/EvaluationReport만 Pydantic 모델)
+@dataclass(slots=True)
+class SimilarityMetrics:
     """유사도 세부 지표"""
-    equipment_category_similarity: float = Field(
-        description="장비 카테고리 분포 유사도 (코사인, 0~1)"
-    )
-    equipment_name_overlap: float = Field(
-        description="장비명 겹침 비율 (Jaccard, 0~1)"
-    )
-    equipment_count_accuracy: float = Field(
-        description="장비 수 정확도 (0~1, 1=정확히 일치)"
-    )
-    zone_ratio_similarity: float = Field(
-        description="구역 비율 유사도 (코사인, 0~1)"
-    )
-    overall_similarity: float = Field(
-        description="종합 유사도 점수 (0~100)"
-    )
+    equipment_category_similarity: float  # 장비 카테고리 분포 유사도 (코사인, 0~1)
+    equipment_name_overlap: float          # 장비명 겹침 비율 (Jaccard, 0~1)
+    equipment_count_accuracy: float        # 장비 수 정확도 (0~1, 1=정확히 일치)
+    zone_ratio_similarity: float           # 구역 비율 유사도 (코사인, 0~1)
+    overall_similarity: float              # 종합 유사도 점수 (0~100)
+
+    def rounded(self) -> "SimilarityMetrics":
+        """표시용 반올림 사본 (내부 계산은 원본 정밀도 유지)"""
+        return SimilarityMetrics(
+            equipment_category_similarity=round(self.equipment_category_similarity, 3),
+            equipment_name_overlap=round(self.equipment_name_overlap, 3),
+            equipment_count_accuracy=round(self.equipment_count_accuracy, 3),
+            zone_ratio_similarity=round(self.zone_ratio_similarity, 3),
+            overall_similarity=round(self.overall_similarity, 1),
+        )
 
 
-class CaseComparison(BaseModel):
+@dataclass(slots=True)
+class CaseComparison:
     """개별 사례와의 비교 결과"""
     case_number: int
     business_type: str
     kitchen_area_py: Optional[float]
     similarity_metrics: SimilarityMetrics
-    matched_equipment: List[str] = Field(
-        default_factory=list, description="일치하는 장비명"
-    )
-    missing_equipment: List[str] = Field(
-        default_factory=list, description="실 사례에는 있지만 생성에 없는 장비"
-    )
-    extra_equipment: List[str] = Field(
-        default_factory=list, description="생성에는 있지만 실 사례에 없는 장비"
-    )
+    # 일치하는 장비명
+    matched_equipment: List[str] = field(default_factory=list)
+    # 실 사례에는 있지만 생성에 없는 장비
+    missing_equipment: List[str] = field(default_factory=list)
+    # 생성에는 있지만 실 사례에 없는 장비
+    extra_equipment: List[str] = field(default_factory=list)
 
 
 class EvaluationResult(BaseModel):
@@ -61,6 +63,18 @@ class EvaluationResult(BaseModel):
     )
     grade: str = Field(description="등급: S/A/B/C/D")
 
+    # 유사도 지표는 직렬화 시점에만 반올림
+    @field_serializer("avg_similarity")
+    def _serialize_avg_similarity(self, metrics: SimilarityMetrics):
+        return metrics.rounded()
+
+    @field_serializer("case_comparisons")
+    def _serialize_case_comparisons(self, comparisons: List[CaseComparison]):
+        return [
+            replace(c, similarity_metrics=c.similarity_metrics.rounded())
+            for c in comparisons
+        ]
+
 
 class EvaluationReport(BaseModel):
     """다중 생성 결과 평가 리포트"""
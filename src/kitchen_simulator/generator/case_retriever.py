@@ -1,28 +1,101 @@
 """유사 사례 검색 엔진 - 396건 실데이터에서 조건 기반 검색"""
 import json
-import math
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from .models import SimilarCase
 
+# orjson이 있으면 빠른 파서 사용 (선택 의존성)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 기본 데이터셋 경로
 DEFAULT_DATASET_PATH = Path(__file__).parent.parent.parent.parent / "data" / "extracted" / "dataset.json"
 
 
+@lru_cache(maxsize=4)
+def _load_cases(path: str) -> List[dict]:
+    """데이터셋 로드 (프로세스 내 경로별 1회 파싱)
+
+    EquipmentGenerator/Evaluator 등 여러 CaseRetriever가 같은 파싱 결과를
+    공유하고, fork된 워커 프로세스도 부모의 캐시를 그대로 물려받는다.
+    """
+    if orjson is not None:
+        data = orjson.loads(Path(path).read_bytes())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    cases = data.get("cases", [])
+    # Add case_number as index since dataset doesn't have it
+    for idx, case in enumerate(cases):
+        if "basic_info" not in case:
+            case["basic_info"] = {}
+        case["basic_info"]["case_number"] = idx
+    return cases
+
+
 class CaseRetriever:
     """유사 사례 검색"""
 
     def __init__(self, dataset_path: Optional[str] = None):
         path = Path(dataset_path) if dataset_path else DEFAULT_DATASET_PATH
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        self.cases: List[dict] = data.get("cases", [])
-        # Add case_number as index since dataset doesn't have it
-        for idx, case in enumerate(self.cases):
-            if "basic_info" not in case:
-                case["basic_info"] = {}
-            case["basic_info"]["case_number"] = idx
+        self.cases: List[dict] = _load_cases(str(path.resolve()))
+        # 케이스 번호 → 원본 데이터 인덱스 (O(1) 조회)
+        self._by_number: Dict[int, dict] = {
+            c["basic_info"]["case_number"]: c for c in self.cases
+        }
+        self._build_feature_arrays()
+        # 반복 질의 메모이제이션 (배치 평가 시 동일 조건 재검색 방지)
+        self._find_similar_cached = lru_cache(maxsize=512)(self._find_similar_uncached)
+        self._equipment_union_cached = lru_cache(maxsize=512)(self._equipment_union_uncached)
+
+    def _build_feature_arrays(self):
+        """유사도 벡터 연산용 사례 특성 배열 사전 계산 (SoA)
+
+        점수 계산은 이 배열들만 읽고, self.cases는 결과 조립에만 사용
+        """
+        areas = []
+        biz_ids = []
+        shape_ids = []
+        eq_counts = []
+        self._biz_index: Dict[Optional[str], int] = {}
+        self._shape_index: Dict[str, int] = {}
+
+        for case in self.cases:
+            basic = case.get("basic_info", {})
+            dims = case.get("kitchen_dimensions") or {}
+            eq_counts.append(len(case.get("equipment_list", [])))
+
+            case_area = basic.get("kitchen_area_py")
+            # 면적 없음/0 이하는 NaN으로 표시해 면적 점수에서 제외
+            areas.append(case_area if case_area and case_area > 0 else np.nan)
+
+            case_biz = basic.get("business_type_category", "")
+            biz_ids.append(self._biz_index.setdefault(case_biz, len(self._biz_index)))
+
+            case_shape = dims.get("shape_type", "")
+            if case_shape:
+                key = case_shape.lower()
+                shape_ids.append(self._shape_index.setdefault(key, len(self._shape_index)))
+            else:
+                shape_ids.append(-1)
+
+        self._areas = np.array(areas, dtype=np.float64)
+        self._biz_ids = np.array(biz_ids, dtype=np.int32)
+        self._shape_ids = np.array(shape_ids, dtype=np.int32)
+        self._eq_counts = np.array(eq_counts, dtype=np.int32)
+
+        # 업종별 사례 인덱스 (역색인, 원본 순서 유지)
+        self._by_biz: Dict[Optional[str], np.ndarray] = {
+            biz: np.flatnonzero(self._biz_ids == biz_id)
+            for biz, biz_id in self._biz_index.items()
+        }
 
     def find_similar(
         self,
@@ -47,77 +120,119 @@ class CaseRetriever:
         Returns:
             유사도 내림차순 사례 리스트
         """
-        scored_cases = []
-
-        for case in self.cases:
-            score = self._calculate_similarity(
-                case, business_type, kitchen_area_py, shape_type
+        # 캐시에는 불변 튜플만 두고 호출마다 새 SimilarCase를 만든다
+        # (반환값을 수정해도 다음 검색 결과에 영향 없음)
+        records = self._find_similar_cached(business_type, kitchen_area_py, shape_type, top_k)
+        return [
+            SimilarCase(
+                case_number=number,
+                business_type=biz,
+                kitchen_area_py=area,
+                equipment_count=eq_count,
+                similarity_score=score,
+                equipment_names=list(names),
+                zone_names=list(zone_names),
             )
-            if score > 0:
-                scored_cases.append((case, score))
+            for number, biz, area, eq_count, score, names, zone_names in records
+        ]
 
-        # 유사도 내림차순 정렬
-        scored_cases.sort(key=lambda x: x[1], reverse=True)
+    def _find_similar_uncached(
+        self,
+        business_type: str,
+        kitchen_area_py: float,
+        shape_type: Optional[str],
+        top_k: int,
+    ) -> Tuple[tuple, ...]:
+        """유사 사례 검색 (캐시 미적용 원본)
+
+        Returns:
+            (사례 번호, 업종, 면적, 장비 수, 유사도, 장비명 튜플, 구역명 튜플) 튜플
+        """
+        top = self._top_in_biz_bucket(business_type, kitchen_area_py, shape_type, top_k)
+        if top is None:
+            scores = self._score_all(business_type, kitchen_area_py, shape_type)
+            # 유사도 내림차순 정렬 (동점은 원본 순서 유지)
+            order = np.argsort(-scores, kind="stable")[:top_k]
+            top = [(i, scores[i]) for i in order]
 
         results = []
-        for case, score in scored_cases[:top_k]:
+        for i, score in top:
+            if score <= 0:
+                continue
+            case = self.cases[i]
             basic = case.get("basic_info", {})
             equipment_list = case.get("equipment_list", [])
             zones = case.get("zones", [])
 
-            results.append(SimilarCase(
-                case_number=basic.get("case_number", 0),
-                business_type=basic.get("business_type_category", "unknown"),
-                kitchen_area_py=basic.get("kitchen_area_py"),
-                equipment_count=len(equipment_list),
-                similarity_score=round(score, 3),
-                equipment_names=[
-                    eq.get("name", "") for eq in equipment_list if eq.get("name")
-                ],
-                zone_names=[
-                    z.get("zone_name", "") for z in zones if z.get("zone_name")
-                ],
+            results.append((
+                basic.get("case_number", 0),
+                basic.get("business_type_category", "unknown"),
+                basic.get("kitchen_area_py"),
+                int(self._eq_counts[i]),
+                round(float(score), 3),
+                tuple(eq.get("name", "") for eq in equipment_list if eq.get("name")),
+                tuple(z.get("zone_name", "") for z in zones if z.get("zone_name")),
             ))
 
-        return results
+        return tuple(results)
+
+    def _top_in_biz_bucket(
+        self,
+        target_biz: str,
+        target_area: float,
+        target_shape: Optional[str],
+        top_k: int,
+    ) -> Optional[List[Tuple[int, float]]]:
+        """동일 업종 사례만으로 상위 k개 결정 시도
+
+        업종 불일치 사례의 최대 점수(0.1 + 0.3 + 형태 점수)보다
+        k번째 점수가 높으면 전체 탐색과 결과가 같다. 아니면 None.
+        """
+        bucket = self._by_biz.get(target_biz)
+        if bucket is None or top_k <= 0 or len(bucket) < top_k:
+            return None
+
+        scores = self._score_all(target_biz, target_area, target_shape, bucket)
+        order = np.argsort(-scores, kind="stable")[:top_k]
+
+        mismatch_max = 0.1 + 0.3 + (0.2 if target_shape else 0.1)
+        if scores[order[-1]] <= mismatch_max:
+            return None
+        return [(bucket[j], scores[j]) for j in order]
 
-    def _calculate_similarity(
+    def _score_all(
         self,
-        case: dict,
         target_biz: str,
         target_area: float,
         target_shape: Optional[str],
-    ) -> float:
-        """유사도 계산"""
-        basic = case.get("basic_info", {})
-        dims = case.get("kitchen_dimensions") or {}
+        indices: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """사례 유사도 일괄 계산 (SoA 배열 기반)
 
-        score = 0.0
+        Args:
+            indices: 계산할 사례 인덱스 (None이면 전체)
+        """
+        areas, biz_ids, shape_ids = self._areas, self._biz_ids, self._shape_ids
+        if indices is not None:
+            areas, biz_ids, shape_ids = areas[indices], biz_ids[indices], shape_ids[indices]
 
         # 1. 업종 유사도 (가중치 0.5)
-        case_biz = basic.get("business_type_category", "")
-        if case_biz == target_biz:
-            score += 0.5
-        else:
-            score += 0.1  # 다른 업종이라도 최소 점수
+        target_biz_id = self._biz_index.get(target_biz, -1)
+        scores = np.where(biz_ids == target_biz_id, 0.5, 0.1)
 
-        # 2. 면적 유사도 (가중치 0.3, 가우시안)
-        case_area = basic.get("kitchen_area_py")
-        if case_area and case_area > 0:
-            # 면적 차이 비율 기반 가우시안 (σ=0.3 → 30% 차이에서 급감)
-            area_ratio = abs(case_area - target_area) / max(target_area, 1)
-            area_sim = math.exp(-(area_ratio ** 2) / (2 * 0.3 ** 2))
-            score += 0.3 * area_sim
+        # 2. 면적 유사도 (가중치 0.3, 가우시안, σ=0.3 → 30% 차이에서 급감)
+        area_ratio = np.abs(areas - target_area) / max(target_area, 1)
+        area_sim = np.exp(-(area_ratio ** 2) / (2 * 0.3 ** 2))
+        scores += np.where(np.isnan(areas), 0.0, 0.3 * area_sim)
 
         # 3. 형태 유사도 (가중치 0.2)
         if target_shape:
-            case_shape = dims.get("shape_type", "")
-            if case_shape and case_shape.lower() == target_shape.lower():
-                score += 0.2
+            target_shape_id = self._shape_index.get(target_shape.lower(), -2)
+            scores += np.where(shape_ids == target_shape_id, 0.2, 0.0)
         else:
-            score += 0.1  # 형태 미지정 시 기본점
+            scores += 0.1  # 형태 미지정 시 기본점
 
-        return score
+        return scores
 
     def get_equipment_union(
         self, cases: List[SimilarCase]
@@ -127,14 +242,27 @@ class CaseRetriever:
         Returns:
             {장비명: (카테고리, 가중평균_신뢰도)}
         """
+        case_keys = tuple(
+            (similar.case_number, similar.similarity_score) for similar in cases
+        )
+        return dict(self._equipment_union_cached(case_keys))
+
+    def _equipment_union_uncached(
+        self, case_keys: Tuple[Tuple[int, float], ...]
+    ) -> Dict[str, Tuple[str, float]]:
+        """장비 합집합 계산 (캐시 미적용 원본)
+
+        Args:
+            case_keys: (사례 번호, 유사도 점수) 튜플
+        """
         # 원본 데이터에서 장비 정보 추출 필요
-        equipment_scores: Dict[str, List[Tuple[str, float]]] = {}
+        # 장비명 → (카테고리 빈도, 가중치 목록)
+        equipment_scores: Dict[str, Tuple[Counter, List[float]]] = {}
 
-        for similar in cases:
-            weight = similar.similarity_score
+        for case_number, weight in case_keys:
             # similar_case에는 equipment_names만 있으므로
             # 원본 케이스에서 카테고리도 가져와야 함
-            original = self._find_case(similar.case_number)
+            original = self._find_case(case_number)
             if not original:
                 continue
 
@@ -142,23 +270,22 @@ class CaseRetriever:
                 name = eq.get("name") or ""
                 cat = eq.get("category") or "other"
                 if name:
-                    if name not in equipment_scores:
-                        equipment_scores[name] = []
-                    equipment_scores[name].append((cat, weight))
+                    entry = equipment_scores.get(name)
+                    if entry is None:
+                        entry = equipment_scores[name] = (Counter(), [])
+                    entry[0][cat] += 1
+                    entry[1].append(weight)
 
         # 가중 평균
         result = {}
-        for name, entries in equipment_scores.items():
-            # 가장 빈번한 카테고리
-            cat = max(set(c for c, _ in entries), key=lambda c: sum(1 for cc, _ in entries if cc == c))
-            avg_score = sum(w for _, w in entries) / len(cases) if cases else 0
+        for name, (cat_counts, weights) in equipment_scores.items():
+            # 가장 빈번한 카테고리 (동률이면 먼저 나온 카테고리)
+            cat = cat_counts.most_common(1)[0][0]
+            avg_score = sum(weights) / len(case_keys) if case_keys else 0
             result[name] = (cat, round(avg_score, 3))
 
         return result
 
     def _find_case(self, case_number: int) -> Optional[dict]:
         """케이스 번호로 원본 데이터 찾기"""
-        for case in self.cases:
-            if case.get("basic_info", {}).get("case_number") == case_number:
-                return case
-        return None
+        return self._by_number.get(case_number)
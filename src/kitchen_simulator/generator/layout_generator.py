@@ -9,6 +9,13 @@ from ..data.equipment_catalog import EQUIPMENT_CATALOG
 from ..engine.optimizer import Optimizer, OptimizationResult
 from ..patterns.provider import PatternProvider
 
+# enum 값에 없는 업종 문자열의 유사 매핑
+_RESTAURANT_TYPE_FALLBACK: Dict[str, RestaurantType] = {
+    "franchise": RestaurantType.FAST_FOOD,
+    "snack_bar": RestaurantType.FAST_FOOD,
+    "other": RestaurantType.CASUAL,
+}
+
 
 class LayoutGenerator:
     """C3 통합 생성기 - 업종+면적+형태 → 장비 리스트 + 최적 배치"""
@@ -58,7 +65,7 @@ class LayoutGenerator:
         )
 
         # 2. EquipmentSpec 변환
-        equipment_specs = self._to_equipment_specs(generated_equipment)
+        equipment_specs, mapped_count = self._to_equipment_specs(generated_equipment)
 
         # 3. Kitchen 객체 생성
         area_sqm = kitchen_area_py * 3.306  # 평 → m²
@@ -100,46 +107,41 @@ class LayoutGenerator:
             generated_equipment=generated_equipment,
             recommended_zone_ratios=zone_ratios,
             generation_method="retrieval_augmented_statistical",
-            pattern_coverage=self._calc_coverage(generated_equipment),
+            pattern_coverage=self._calc_coverage(mapped_count, len(generated_equipment)),
         )
 
         return gen_result, opt_result
 
     def _to_equipment_specs(
         self, generated: List[GeneratedEquipment]
-    ) -> List[EquipmentSpec]:
-        """GeneratedEquipment → EquipmentSpec 변환"""
-        specs = []
-        seen_ids = set()
+    ) -> Tuple[List[EquipmentSpec], int]:
+        """GeneratedEquipment → EquipmentSpec 변환
 
+        Returns:
+            (EquipmentSpec 리스트, catalog_id가 매핑된 장비 수)
+        """
+        specs = []
+        mapped_count = 0
         for eq in generated:
             catalog_id = eq.catalog_id
-            if catalog_id and catalog_id in EQUIPMENT_CATALOG:
-                spec = EQUIPMENT_CATALOG[catalog_id]
+            if not catalog_id:
+                # catalog_id가 없는 장비는 스킵 (카탈로그에 없는 장비)
+                continue
+            mapped_count += 1
+            spec = EQUIPMENT_CATALOG.get(catalog_id)
+            if spec is not None:
                 # 중복 허용 (같은 장비 여러 개 배치 가능)
                 specs.append(spec)
-            # catalog_id가 없는 장비는 스킵 (카탈로그에 없는 장비)
-
-        return specs
+        return specs, mapped_count
 
     def _map_restaurant_type(self, business_type: str) -> RestaurantType:
         """업종 문자열 → RestaurantType enum 매핑"""
-        # 직접 매핑 시도
-        for rt in RestaurantType:
-            if rt.value == business_type:
-                return rt
-
-        # 유사 매핑
-        FALLBACK_MAP = {
-            "franchise": RestaurantType.FAST_FOOD,
-            "snack_bar": RestaurantType.FAST_FOOD,
-            "other": RestaurantType.CASUAL,
-        }
-        return FALLBACK_MAP.get(business_type, RestaurantType.CASUAL)
-
-    def _calc_coverage(self, equipment: List[GeneratedEquipment]) -> float:
+        return RestaurantType.from_value(business_type) or _RESTAURANT_TYPE_FALLBACK.get(
+            business_type, RestaurantType.CASUAL
+        )
+
+    def _calc_coverage(self, mapped_count: int, total: int) -> float:
         """패턴 커버리지 계산 (카탈로그 매핑 비율)"""
-        if not equipment:
+        if not total:
             return 0.0
-        mapped = sum(1 for eq in equipment if eq.catalog_id)
-        return round(mapped / len(equipment), 3)
+        return round(mapped_count / total, 3)
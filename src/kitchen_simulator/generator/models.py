@@ -1,54 +1,52 @@
 """C3 생성 결과 데이터 모델"""
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Tuple
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
 
 
-class SimilarCase(BaseModel):
+# 생성 파이프라인 내부 루프에서 대량 생성되므로 검증 없는 slots 데이터클래스로 둔다
+# (기존 pydantic 모델과 같이 키워드 전용 생성, 필드 순서 유지)
+@dataclass(slots=True, kw_only=True)
+class SimilarCase:
     """유사 사례 검색 결과"""
-    case_number: int = Field(description="사례 번호")
-    business_type: str = Field(description="업종")
-    kitchen_area_py: Optional[float] = Field(default=None, description="주방 면적(평)")
-    equipment_count: int = Field(description="장비 수")
-    similarity_score: float = Field(description="유사도 점수 (0~1)")
-    equipment_names: List[str] = Field(default_factory=list, description="장비명 목록")
-    zone_names: List[str] = Field(default_factory=list, description="구역명 목록")
+    case_number: int                      # 사례 번호
+    business_type: str                    # 업종
+    kitchen_area_py: Optional[float] = None  # 주방 면적(평)
+    equipment_count: int                  # 장비 수
+    similarity_score: float               # 유사도 점수 (0~1)
+    equipment_names: List[str] = field(default_factory=list)  # 장비명 목록
+    zone_names: List[str] = field(default_factory=list)       # 구역명 목록
 
 
-class GeneratedEquipment(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class GeneratedEquipment:
     """생성된 장비 항목"""
-    equipment_name: str = Field(description="장비명 (한국어, 패턴 데이터 원본)")
-    category: str = Field(description="카테고리")
-    quantity: int = Field(default=1, description="수량")
-    confidence: float = Field(description="신뢰도 (0~1, 패턴 출현비율 기반)")
-    source: str = Field(default="pattern", description="출처: pattern/similar_case/co_occurrence")
-    catalog_id: Optional[str] = Field(default=None, description="매칭된 카탈로그 장비 ID")
+    equipment_name: str                   # 장비명 (한국어, 패턴 데이터 원본)
+    category: str                         # 카테고리
+    quantity: int = 1                     # 수량
+    confidence: float                     # 신뢰도 (0~1, 패턴 출현비율 기반)
+    source: str = "pattern"               # 출처: pattern/similar_case/co_occurrence
+    catalog_id: Optional[str] = None      # 매칭된 카탈로그 장비 ID
 
 
-class GenerationResult(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class GenerationResult:
     """C3 생성 결과"""
-    business_type: str = Field(description="입력 업종")
-    kitchen_area_py: float = Field(description="입력 면적(평)")
+    business_type: str                    # 입력 업종
+    kitchen_area_py: float                # 입력 면적(평)
 
-    # 유사 사례
-    similar_cases: List[SimilarCase] = Field(
-        default_factory=list, description="검색된 유사 사례"
-    )
+    # 검색된 유사 사례
+    similar_cases: List[SimilarCase] = field(default_factory=list)
 
-    # 생성된 장비 리스트
-    generated_equipment: List[GeneratedEquipment] = Field(
-        default_factory=list, description="생성된 장비 목록"
-    )
+    # 생성된 장비 목록
+    generated_equipment: List[GeneratedEquipment] = field(default_factory=list)
 
     # 추천 구역 비율
-    recommended_zone_ratios: Dict[str, float] = Field(
-        default_factory=dict, description="추천 구역 비율"
-    )
+    recommended_zone_ratios: Dict[str, float] = field(default_factory=dict)
 
     # 메타데이터
-    generation_method: str = Field(
-        default="retrieval_augmented_statistical",
-        description="생성 방식"
-    )
-    pattern_coverage: float = Field(
-        default=0.0, description="패턴 데이터 커버리지 (0~1)"
-    )
+    generation_method: str = "retrieval_augmented_statistical"  # 생성 방식
+    pattern_coverage: float = 0.0         # 패턴 데이터 커버리지 (0~1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 딕셔너리 (중첩 항목 포함)"""
+        return asdict(self)
@@ -10,6 +10,7 @@ from .collision import (
     check_overlap, check_contains, get_overlap_area,
     check_minimum_distance, get_distance,
     find_placement_candidates, check_aisle_width,
+    get_rectangle_bounds, aabb_distance_matrix,
 )
 from .partitioner import (
     partition_rectangle_for_zones,
@@ -26,6 +27,7 @@ __all__ = [
     "check_overlap", "check_contains", "get_overlap_area",
     "check_minimum_distance", "get_distance",
     "find_placement_candidates", "check_aisle_width",
+    "get_rectangle_bounds", "aabb_distance_matrix",
     "partition_rectangle_for_zones", "partition_l_shape_for_zones",
     "adjust_zone_ratios_for_restaurant_type",
 ]
@@ -1,6 +1,8 @@
 """충돌 감지 유틸리티"""
+import math
 from typing import List, Tuple, Optional
-from shapely.geometry import Polygon, Point, LineString
+import shapely
+from shapely.geometry import Polygon, Point, LineString, box
 import numpy as np
 
 def check_overlap(poly1: Polygon, poly2: Polygon) -> bool:
@@ -47,45 +49,245 @@ def find_placement_candidates(
     Returns:
         배치 가능한 (x, y) 좌표 리스트
     """
-    from .polygon import create_rectangle
-
     equip_gap = equip_clearance if equip_clearance is not None else clearance
     wall_clearance = clearance
 
     minx, miny, maxx, maxy = container.bounds
-    candidates = []
 
     # 벽 이격만 고려한 유효 영역
-    effective_container = container.buffer(-wall_clearance)
-    if effective_container.is_empty:
+    # 축 정렬 사각형은 경계를 직접 줄여 만든다 (GEOS 침식 연산 생략)
+    if _is_axis_aligned_rectangle(container):
+        ex0, ey0 = minx + wall_clearance, miny + wall_clearance
+        ex1, ey1 = maxx - wall_clearance, maxy - wall_clearance
+        if ex0 >= ex1 or ey0 >= ey1:
+            return []
+        effective_container = box(ex0, ey0, ex1, ey1)
+    else:
+        effective_container = container.buffer(-wall_clearance)
+        if effective_container.is_empty:
+            return []
+
+    # 그리드 좌표 (기존 누적 방식 그대로: x 바깥, y 안쪽 순회 순서 유지)
+    xs = _grid_axis(minx + wall_clearance, item_width, maxx - wall_clearance, grid_step)
+    ys = _grid_axis(miny + wall_clearance, item_height, maxy - wall_clearance, grid_step)
+    if not xs or not ys:
         return []
 
-    # 그리드 탐색
-    x = minx + wall_clearance
-    while x + item_width <= maxx - wall_clearance:
-        y = miny + wall_clearance
-        while y + item_height <= maxy - wall_clearance:
-            item_poly = create_rectangle(x, y, item_width, item_height)
+    gx, gy = np.meshgrid(np.array(xs), np.array(ys), indexing="ij")
+    gx = gx.ravel()
+    gy = gy.ravel()
+
+    # 컨테이너 내부에 있는지 (셀 전체 일괄 판정)
+    if _is_axis_aligned_rectangle(effective_container):
+        # 사각형 영역이면 포함 여부 = 경계 비교 (GEOS 호출 없음)
+        ex0, ey0, ex1, ey1 = effective_container.bounds
+        inside = np.flatnonzero(
+            (gx >= ex0) & (gx + item_width <= ex1)
+            & (gy >= ey0) & (gy + item_height <= ey1)
+        )
+    else:
+        # L/U자 등: 네 꼭짓점이 모두 영역(경계 포함)에 닿는 셀만 정확히 판정
+        shapely.prepare(effective_container)
+        gx1, gy1 = gx + item_width, gy + item_height
+        corners_in = (
+            shapely.intersects_xy(effective_container, gx, gy)
+            & shapely.intersects_xy(effective_container, gx1, gy)
+            & shapely.intersects_xy(effective_container, gx1, gy1)
+            & shapely.intersects_xy(effective_container, gx, gy1)
+        )
+        inside = np.flatnonzero(corners_in)
+        items = shapely.box(gx[inside], gy[inside], gx1[inside], gy1[inside])
+        inside = inside[shapely.contains(effective_container, items)]
+    if not existing or len(inside) == 0:
+        return [(float(gx[k]), float(gy[k])) for k in inside]
+
+    # 기존 배치와 충돌하는지 (장비 간 간격 사용)
+    # 셀을 TILE x TILE 묶음으로 나눠 기존 배치와 먼 타일은 셀 단위 검사 생략
+    ny = len(ys)
+    tiles_per_col = (ny + _TILE - 1) // _TILE
+    tile_ids = (inside // ny // _TILE) * tiles_per_col + (inside % ny) // _TILE
+    collision = _buffered_collisions(
+        gx[inside], gy[inside], item_width, item_height, equip_gap, existing, tile_ids
+    )
+    return [(float(gx[k]), float(gy[k])) for k in inside[~collision]]
+
+# 계층 탐색 타일 크기 (한 변의 셀 수)
+_TILE = 4
+
+# (박스 수 x 기존 수)가 이 이하이면 STRtree 대신 브로드캐스팅으로 겹침 판정
+_BROADCAST_MAX_PAIRS = 200_000
+
+def _grid_axis(start: float, size: float, limit: float, step: float) -> List[float]:
+    """그리드 한 축의 좌표 (start부터 step씩 누적, 아이템이 limit를 넘지 않는 범위)"""
+    values = []
+    v = start
+    while v + size <= limit:
+        values.append(v)
+        v += step
+    return values
+
+def _buffered_collisions(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    item_width: float,
+    item_height: float,
+    gap: float,
+    existing: List[Polygon],
+    tile_ids: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """셀별로 item.buffer(gap)이 기존 다각형 중 하나와 교차하는지 판정
+
+    tile_ids가 주어지면 먼저 타일(셀 묶음) 전체의 버퍼 바운딩 박스로
+    기존 배치와 먼 타일을 통째로 제외한다 (거친 단계).
+    남은 셀은 버퍼 바운딩 박스와 겹치는 (셀, 기존) 쌍만 뽑고
+    (쌍이 적으면 브로드캐스팅 비교, 많으면 STRtree 조회),
+    기존이 사각형이면 버퍼의 직선 구간(십자 영역)과 겹치는 쌍은 확실한
+    교차로 처리한다. 둥근 모서리 근처처럼 애매한 쌍만 Shapely
+    buffer/intersects로 정확히 판정한다.
+    """
+    eps = 1e-9
+    collision = np.zeros(len(xs), dtype=bool)
+
+    # 버퍼 바운딩 박스와 떨어져 있으면 확실히 비교차
+    # (기존 다각형 bounds는 (E, 4) 배열로 한 번만 추출)
+    ex_geoms = np.asarray(existing, dtype=object)
+    ex_bounds = shapely.bounds(ex_geoms)
+    tree = None
+
+    def envelope_pairs(bx0, by0, bx1, by1):
+        """박스와 바운딩 박스가 겹치는 (박스, 기존) 인덱스 쌍"""
+        nonlocal tree
+        if len(bx0) * len(ex_bounds) <= _BROADCAST_MAX_PAIRS:
+            # (N, E) 불리언 행렬 한 번으로 판정 (STRtree 구축/조회 생략)
+            return np.nonzero(
+                (bx0[:, None] <= ex_bounds[None, :, 2]) & (bx1[:, None] >= ex_bounds[None, :, 0])
+                & (by0[:, None] <= ex_bounds[None, :, 3]) & (by1[:, None] >= ex_bounds[None, :, 1])
+            )
+        if tree is None:
+            tree = shapely.STRtree(ex_geoms)
+        return tree.query(shapely.box(bx0, by0, bx1, by1))
 
-            # 컨테이너 내부에 있는지
-            if not effective_container.contains(item_poly):
-                y += grid_step
-                continue
+    x0, y0 = xs, ys
+    x1, y1 = xs + item_width, ys + item_height
 
-            # 기존 배치와 충돌하는지 (장비 간 간격 사용)
-            collision = False
-            for existing_poly in existing:
-                if item_poly.buffer(equip_gap).intersects(existing_poly):
-                    collision = True
-                    break
+    # 거친 단계: 타일 바운딩 박스는 소속 셀 박스를 모두 포함하므로
+    # 타일이 기존 배치와 멀면 그 안의 셀도 모두 멀다
+    active = np.arange(len(xs))
+    if tile_ids is not None:
+        tiles, tile_of = np.unique(tile_ids, return_inverse=True)
+        tx0 = np.full(len(tiles), np.inf)
+        ty0 = np.full(len(tiles), np.inf)
+        tx1 = np.full(len(tiles), -np.inf)
+        ty1 = np.full(len(tiles), -np.inf)
+        np.minimum.at(tx0, tile_of, x0)
+        np.minimum.at(ty0, tile_of, y0)
+        np.maximum.at(tx1, tile_of, x1)
+        np.maximum.at(ty1, tile_of, y1)
+        near_tiles = np.unique(
+            envelope_pairs(tx0 - gap - eps, ty0 - gap - eps, tx1 + gap + eps, ty1 + gap + eps)[0]
+        )
+        active = np.flatnonzero(np.isin(tile_of, near_tiles))
 
-            if not collision:
-                candidates.append((x, y))
+    # 세밀 단계: 기존 배치 근처 타일의 셀만 개별 조회
+    cell_idx, poly_idx = envelope_pairs(
+        x0[active] - gap - eps, y0[active] - gap - eps,
+        x1[active] + gap + eps, y1[active] + gap + eps,
+    )
+    cell_idx = active[cell_idx]
+    if len(cell_idx) == 0:
+        return collision
 
-            y += grid_step
-        x += grid_step
+    # 기존이 사각형이면 십자 영역과 겹칠 때 확실히 교차
+    ex_is_rect = _axis_aligned_rectangle_mask(ex_geoms, ex_bounds)
+    ex = ex_bounds[poly_idx]
+    is_rect = ex_is_rect[poly_idx]
+    cx0, cy0, cx1, cy1 = x0[cell_idx], y0[cell_idx], x1[cell_idx], y1[cell_idx]
 
-    return candidates
+    def overlaps(ax0, ay0, ax1, ay1):
+        return (
+            (ex[:, 0] < ax1 - eps) & (ex[:, 2] > ax0 + eps)
+            & (ex[:, 1] < ay1 - eps) & (ex[:, 3] > ay0 + eps)
+        )
+
+    hit = is_rect & (
+        overlaps(cx0 - gap, cy0, cx1 + gap, cy1) | overlaps(cx0, cy0 - gap, cx1, cy1 + gap)
+    )
+    collision[cell_idx[hit]] = True
+
+    # 모서리 근처 쌍은 바운딩 박스 간 거리로 조기 판정
+    # - 박스 거리는 실제 거리의 하한이고 다각형 버퍼는 반경 gap 원 안쪽이므로
+    #   박스 거리 > gap 이면 확실히 비교차
+    # - 기존이 사각형이면 박스 거리가 곧 실제 거리이고, 원호 분할 버퍼는
+    #   반경 gap * cos(π/32) 원을 포함하므로 그보다 가까우면 확실히 교차
+    pending = ~hit & ~collision[cell_idx]
+    dx = np.maximum(np.maximum(ex[:, 0] - cx1, cx0 - ex[:, 2]), 0.0)
+    dy = np.maximum(np.maximum(ex[:, 1] - cy1, cy0 - ex[:, 3]), 0.0)
+    dist = np.hypot(dx, dy)
+    near_hit = pending & is_rect & (dist < gap * math.cos(math.pi / 32) - eps)
+    collision[cell_idx[near_hit]] = True
+    pending &= ~near_hit & (dist <= gap + eps) & ~collision[cell_idx]
+
+    # 나머지 애매한 쌍은 정확히 판정
+    cell_idx, poly_idx = cell_idx[pending], poly_idx[pending]
+    if len(cell_idx):
+        cells, inverse = np.unique(cell_idx, return_inverse=True)
+        items = shapely.box(x0[cells], y0[cells], x1[cells], y1[cells])
+        # Polygon.buffer와 동일한 원호 분할 (shapely.buffer 기본값은 8)
+        buffered = shapely.buffer(items, gap, quad_segs=16)
+        exact = shapely.intersects(buffered[inverse], ex_geoms[poly_idx])
+        collision[cell_idx[exact]] = True
+    return collision
+
+def _axis_aligned_rectangle_mask(geoms: np.ndarray, bounds: np.ndarray) -> np.ndarray:
+    """다각형 배열 각각이 구멍 없는 축 정렬 사각형인지 (_is_axis_aligned_rectangle 벡터화)"""
+    box_area = (bounds[:, 2] - bounds[:, 0]) * (bounds[:, 3] - bounds[:, 1])
+    return (
+        (shapely.get_type_id(geoms) == shapely.GeometryType.POLYGON)
+        & (shapely.get_num_interior_rings(geoms) == 0)
+        & (shapely.get_num_coordinates(geoms) == 5)
+        & (np.abs(shapely.area(geoms) - box_area) <= 1e-9 * np.maximum(1.0, box_area))
+    )
+
+def _is_axis_aligned_rectangle(poly: Polygon) -> bool:
+    """구멍 없는 축 정렬 사각형인지 (바운딩 박스와 동일한 다각형)"""
+    if poly.geom_type != "Polygon" or poly.interiors or len(poly.exterior.coords) != 5:
+        return False
+    minx, miny, maxx, maxy = poly.bounds
+    box_area = (maxx - minx) * (maxy - miny)
+    return abs(poly.area - box_area) <= 1e-9 * max(1.0, box_area)
+
+def get_rectangle_bounds(polys: List[Polygon]) -> Optional[np.ndarray]:
+    """모두 축 정렬 사각형이면 (n, 4) bounds 배열 반환, 아니면 None
+
+    꼭짓점 4개이면서 면적이 바운딩 박스 면적과 같은 다각형은
+    바운딩 박스 자체이므로 bounds만으로 거리/겹침을 정확히 계산할 수 있다.
+    """
+    if not polys:
+        return np.empty((0, 4), dtype=np.float64)
+
+    bounds = np.empty((len(polys), 4), dtype=np.float64)
+    for i, poly in enumerate(polys):
+        if not _is_axis_aligned_rectangle(poly):
+            return None
+        bounds[i] = poly.bounds
+    return bounds
+
+def aabb_distance_matrix(bounds: np.ndarray) -> np.ndarray:
+    """축 정렬 사각형 쌍별 최단 거리 행렬 (겹치거나 접하면 0)"""
+    dx = np.maximum(
+        np.maximum(bounds[None, :, 0] - bounds[:, None, 2],
+                   bounds[:, None, 0] - bounds[None, :, 2]),
+        0.0,
+    )
+    dy = np.maximum(
+        np.maximum(bounds[None, :, 1] - bounds[:, None, 3],
+                   bounds[:, None, 1] - bounds[None, :, 3]),
+        0.0,
+    )
+    return np.hypot(dx, dy)
+
+# 이 개수 이하이면 STRtree 대신 중심 거리 전체 쌍 사전 필터 사용
+_AISLE_PAIRWISE_MAX = 256
 
 def check_aisle_width(
     container: Polygon,
@@ -99,15 +301,58 @@ def check_aisle_width(
     """
     violations = []
 
-    # 모든 배치 쌍에 대해 거리 확인
-    for i in range(len(placements)):
-        for j in range(i + 1, len(placements)):
-            dist = placements[i].distance(placements[j])
-            if 0 < dist < min_width:
-                # 중간 지점을 위반 위치로
-                c1 = placements[i].centroid
-                c2 = placements[j].centroid
-                mid = ((c1.x + c2.x) / 2, (c1.y + c2.y) / 2)
-                violations.append((mid, dist))
+    # 축 정렬 사각형이면 bounds 배열로 전체 쌍 거리를 한 번에 계산
+    bounds = get_rectangle_bounds(placements)
+    if bounds is not None:
+        dists = aabb_distance_matrix(bounds)
+        mask = np.triu((dists > 0) & (dists < min_width), k=1)
+        for i, j in zip(*np.nonzero(mask)):
+            c1 = placements[i].centroid
+            c2 = placements[j].centroid
+            mid = ((c1.x + c2.x) * 0.5, (c1.y + c2.y) * 0.5)
+            violations.append((mid, float(dists[i, j])))
+        return violations
+
+    geoms = np.asarray(placements, dtype=object)
+    centroids = shapely.get_coordinates(shapely.centroid(geoms))
+    if len(placements) <= _AISLE_PAIRWISE_MAX:
+        # 소규모: 중심 간 거리 - 외접원 반경 합이 min_width 이상이면 확실히 먼 쌍
+        coords, owner = shapely.get_coordinates(geoms, return_index=True)
+        radii = np.zeros(len(placements))
+        np.maximum.at(
+            radii, owner,
+            np.hypot(coords[:, 0] - centroids[owner, 0], coords[:, 1] - centroids[owner, 1]),
+        )
+        # np.triu_indices는 기존 이중 루프와 같은 (i, j) 사전순
+        left, right = np.triu_indices(len(placements), k=1)
+        gaps = np.hypot(
+            centroids[left, 0] - centroids[right, 0],
+            centroids[left, 1] - centroids[right, 1],
+        ) - radii[left] - radii[right]
+        near = gaps < min_width
+        left, right = left[near], right[near]
+    else:
+        # 대규모: 공간 색인으로 min_width 이내 쌍만 추림
+        tree = shapely.STRtree(geoms)
+        left, right = tree.query(geoms, predicate="dwithin", distance=min_width)
+        keep = left < right
+        left, right = left[keep], right[keep]
+        # 기존 이중 루프와 같은 (i, j) 사전순
+        order = np.lexsort((right, left))
+        left, right = left[order], right[order]
+    if len(left) == 0:
+        return violations
+
+    # 남은 쌍만 정확한 거리 확인
+    dists = shapely.distance(geoms[left], geoms[right])
+
+    for i, j, dist in zip(left, right, dists):
+        if 0 < dist < min_width:
+            # 중간 지점을 위반 위치로
+            mid = (
+                (centroids[i, 0] + centroids[j, 0]) * 0.5,
+                (centroids[i, 1] + centroids[j, 1]) * 0.5,
+            )
+            violations.append((mid, float(dist)))
 
     return violations
@@ -1,8 +1,11 @@
 """공간 분할 알고리즘"""
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
+import numpy as np
+import shapely
 from shapely.geometry import Polygon
 from .polygon import (
-    create_polygon, create_rectangle, get_bounds, get_area,
+    create_polygon, get_bounds, get_area,
     split_rectangle_horizontal, split_rectangle_vertical, buffer_polygon
 )
 from ..domain.zone import ZoneType, ZONE_RATIOS, WORKFLOW_ORDER
@@ -58,33 +61,56 @@ def partition_rectangle_for_zones(
     left_top_ratio = zone_ratios[ZoneType.STORAGE] / (zone_ratios[ZoneType.STORAGE] + zone_ratios[ZoneType.PREPARATION])
     right_top_ratio = zone_ratios[ZoneType.WASHING] / (zone_ratios[ZoneType.WASHING] + zone_ratios[ZoneType.COOKING])
 
-    zones = {}
-
-    # 저장 (좌상)
-    zones[ZoneType.STORAGE] = create_rectangle(
-        minx, miny + height * (1 - left_top_ratio),
-        left_width, height * left_top_ratio
-    )
-
-    # 전처리 (좌하)
-    zones[ZoneType.PREPARATION] = create_rectangle(
-        minx, miny,
-        left_width, height * (1 - left_top_ratio)
-    )
+    # 네 구역 사각형을 한 번에 생성 (저장/전처리/세척/조리 순)
+    # 각 구역: (x, y, 폭, 높이) — create_rectangle과 같은 좌표 계산
+    xs = np.array([minx, minx, minx + left_width, minx + left_width])
+    ys = np.array([
+        miny + height * (1 - left_top_ratio),  # 저장 (좌상)
+        miny,                                  # 전처리 (좌하)
+        miny + height * (1 - right_top_ratio), # 세척 (우상)
+        miny,                                  # 조리 (우하)
+    ])
+    ws = np.array([left_width, left_width, right_width, right_width])
+    hs = np.array([
+        height * left_top_ratio,
+        height * (1 - left_top_ratio),
+        height * right_top_ratio,
+        height * (1 - right_top_ratio),
+    ])
+    rects = shapely.box(xs, ys, xs + ws, ys + hs)
+
+    zones = dict(zip(
+        (ZoneType.STORAGE, ZoneType.PREPARATION, ZoneType.WASHING, ZoneType.COOKING),
+        rects,
+    ))
 
-    # 세척 (우상)
-    zones[ZoneType.WASHING] = create_rectangle(
-        minx + left_width, miny + height * (1 - right_top_ratio),
-        right_width, height * right_top_ratio
-    )
+    return zones
 
-    # 조리 (우하)
-    zones[ZoneType.COOKING] = create_rectangle(
-        minx + left_width, miny,
-        right_width, height * (1 - right_top_ratio)
+def _clip_to_rectangles(
+    region: Polygon,
+    xs: List[float],
+    ys: List[float],
+    widths: List[float],
+    heights: List[float],
+) -> np.ndarray:
+    """region을 여러 사각형과 한 번에 교차 (create_rectangle과 같은 좌표 계산)
+
+    사각형은 오버레이 입력으로만 쓰이므로 개별 Polygon을 만들지 않고
+    shapely.box/intersection 배열 연산 한 번으로 처리한다.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    rects = shapely.box(xs, ys, xs + np.asarray(widths), ys + np.asarray(heights))
+    return shapely.intersection(region, rects)
+
+def _split_upper_lower(region: Polygon, mid_y: float) -> Tuple[Polygon, Polygon]:
+    """region을 mid_y 기준 상/하 두 조각으로 분할"""
+    minx, miny, maxx, maxy = region.bounds
+    width = maxx - minx
+    upper, lower = _clip_to_rectangles(
+        region, [minx, minx], [mid_y, miny], [width, width], [maxy - mid_y, mid_y - miny]
     )
-
-    return zones
+    return upper, lower
 
 def partition_l_shape_for_zones(
     kitchen_poly: Polygon,
@@ -111,12 +137,12 @@ def partition_l_shape_for_zones(
     # 간단한 전략: L자를 세로로 2등분 후 각각 2등분
     mid_x = minx + width * 0.45
 
-    # 좌측 영역을 주방 폴리곤과 교차
-    left_box = create_rectangle(minx, miny, mid_x - minx, height)
-    left_region = kitchen_poly.intersection(left_box)
-
-    right_box = create_rectangle(mid_x, miny, maxx - mid_x, height)
-    right_region = kitchen_poly.intersection(right_box)
+    # 좌/우 영역을 주방 폴리곤과 교차
+    left_region, right_region = _clip_to_rectangles(
+        kitchen_poly,
+        [minx, mid_x], [miny, miny],
+        [mid_x - minx, maxx - mid_x], [height, height],
+    )
 
     if left_region.is_empty or right_region.is_empty:
         # 폴백: 사각형 분할 사용
@@ -126,30 +152,16 @@ def partition_l_shape_for_zones(
     left_bounds = left_region.bounds
     left_mid_y = (left_bounds[1] + left_bounds[3]) / 2
 
-    zones[ZoneType.STORAGE] = left_region.intersection(
-        create_rectangle(left_bounds[0], left_mid_y,
-                        left_bounds[2] - left_bounds[0],
-                        left_bounds[3] - left_mid_y)
-    )
-    zones[ZoneType.PREPARATION] = left_region.intersection(
-        create_rectangle(left_bounds[0], left_bounds[1],
-                        left_bounds[2] - left_bounds[0],
-                        left_mid_y - left_bounds[1])
+    zones[ZoneType.STORAGE], zones[ZoneType.PREPARATION] = _split_upper_lower(
+        left_region, left_mid_y
     )
 
     # 우측: 세척 + 조리
     right_bounds = right_region.bounds
     right_mid_y = (right_bounds[1] + right_bounds[3]) / 2
 
-    zones[ZoneType.WASHING] = right_region.intersection(
-        create_rectangle(right_bounds[0], right_mid_y,
-                        right_bounds[2] - right_bounds[0],
-                        right_bounds[3] - right_mid_y)
-    )
-    zones[ZoneType.COOKING] = right_region.intersection(
-        create_rectangle(right_bounds[0], right_bounds[1],
-                        right_bounds[2] - right_bounds[0],
-                        right_mid_y - right_bounds[1])
+    zones[ZoneType.WASHING], zones[ZoneType.COOKING] = _split_upper_lower(
+        right_region, right_mid_y
     )
 
     return zones
@@ -186,13 +198,11 @@ def partition_u_shape_for_zones(
     left_x = minx + width * (left_ratio / total)
     right_x = minx + width * ((left_ratio + center_ratio) / total)
 
-    left_box = create_rectangle(minx, miny, left_x - minx, height)
-    center_box = create_rectangle(left_x, miny, right_x - left_x, height)
-    right_box = create_rectangle(right_x, miny, maxx - right_x, height)
-
-    left_region = kitchen_poly.intersection(left_box)
-    center_region = kitchen_poly.intersection(center_box)
-    right_region = kitchen_poly.intersection(right_box)
+    left_region, center_region, right_region = _clip_to_rectangles(
+        kitchen_poly,
+        [minx, left_x, right_x], [miny, miny, miny],
+        [left_x - minx, right_x - left_x, maxx - right_x], [height, height, height],
+    )
 
     if left_region.is_empty or center_region.is_empty or right_region.is_empty:
         return partition_l_shape_for_zones(kitchen_poly, zone_ratios)
@@ -205,15 +215,8 @@ def partition_u_shape_for_zones(
     left_mid_y = left_bounds[1] + (left_bounds[3] - left_bounds[1]) * (1 - storage_ratio)
 
     zones = {}
-    zones[ZoneType.STORAGE] = left_region.intersection(
-        create_rectangle(left_bounds[0], left_mid_y,
-                        left_bounds[2] - left_bounds[0],
-                        left_bounds[3] - left_mid_y)
-    )
-    zones[ZoneType.PREPARATION] = left_region.intersection(
-        create_rectangle(left_bounds[0], left_bounds[1],
-                        left_bounds[2] - left_bounds[0],
-                        left_mid_y - left_bounds[1])
+    zones[ZoneType.STORAGE], zones[ZoneType.PREPARATION] = _split_upper_lower(
+        left_region, left_mid_y
     )
 
     zones[ZoneType.COOKING] = center_region
@@ -272,6 +275,12 @@ _STR_TO_ZONE = {
 }
 
 
+@lru_cache(maxsize=1)
+def _pattern_provider():
+    """모듈 공용 PatternProvider (최초 호출 시 1회 생성)"""
+    from ..patterns.provider import PatternProvider
+    return PatternProvider()
+
 def adjust_zone_ratios_from_patterns(
     restaurant_type: str,
 ) -> Dict[ZoneType, float]:
@@ -280,9 +289,7 @@ def adjust_zone_ratios_from_patterns(
     PatternProvider가 사용 불가하면 기존 하드코딩 함수로 fallback.
     """
     try:
-        from ..patterns.provider import PatternProvider
-        provider = PatternProvider()
-        str_ratios = provider.get_zone_ratios(restaurant_type)
+        str_ratios = _pattern_provider().get_zone_ratios(restaurant_type)
 
         # str key → ZoneType enum 변환
         ratios = {}
@@ -1,5 +1,7 @@
 """다각형 연산 유틸리티 - Shapely 래퍼"""
 from typing import List, Tuple, Optional
+import shapely
+from shapely import affinity
 from shapely.geometry import Polygon, Point, box
 from shapely.ops import unary_union
 import numpy as np
@@ -41,41 +43,31 @@ def split_rectangle_horizontal(rect: Polygon, ratios: List[float]) -> List[Polyg
     minx, miny, maxx, maxy = rect.bounds
     total_width = maxx - minx
 
-    parts = []
-    current_x = minx
-    for ratio in ratios:
-        width = total_width * ratio
-        part = box(current_x, miny, current_x + width, maxy)
-        parts.append(part)
-        current_x += width
-
-    return parts
+    # 시작점부터 순차 누적 (기존 current_x += width와 동일한 반올림)
+    widths = total_width * np.asarray(ratios, dtype=np.float64)
+    starts = np.cumsum(np.concatenate(([minx], widths)))[:-1]
+    n = len(widths)
+    return list(shapely.box(starts, np.full(n, miny), starts + widths, np.full(n, maxy)))
 
 def split_rectangle_vertical(rect: Polygon, ratios: List[float]) -> List[Polygon]:
     """사각형을 세로 방향으로 비율에 따라 분할"""
     minx, miny, maxx, maxy = rect.bounds
     total_height = maxy - miny
 
-    parts = []
-    current_y = miny
-    for ratio in ratios:
-        height = total_height * ratio
-        part = box(minx, current_y, maxx, current_y + height)
-        parts.append(part)
-        current_y += height
-
-    return parts
+    # 시작점부터 순차 누적 (기존 current_y += height와 동일한 반올림)
+    heights = total_height * np.asarray(ratios, dtype=np.float64)
+    starts = np.cumsum(np.concatenate(([miny], heights)))[:-1]
+    n = len(heights)
+    return list(shapely.box(np.full(n, minx), starts, np.full(n, maxx), starts + heights))
 
 def rotate_polygon(polygon: Polygon, angle: float, origin: Tuple[float, float] = None) -> Polygon:
     """다각형 회전 (도 단위)"""
-    from shapely import affinity
     if origin is None:
         origin = polygon.centroid
     return affinity.rotate(polygon, angle, origin=origin)
 
 def translate_polygon(polygon: Polygon, dx: float, dy: float) -> Polygon:
     """다각형 이동"""
-    from shapely import affinity
     return affinity.translate(polygon, xoff=dx, yoff=dy)
 
 def create_l_shape(width1: float, height1: float,
@@ -3,27 +3,15 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-
-from .domain.kitchen import Kitchen, KitchenShape, RestaurantType
-from .domain.zone import ZoneType
-from .schemas.input import KitchenInput
-from .schemas.output import (
-    SimulationOutput, ZoneOutput, PlacementOutput,
-    ValidationResult, ScoreMetrics
-)
-from .engine.zone_engine import ZoneEngine
-from .engine.placement_engine import PlacementEngine
-from .engine.validation_engine import ValidationEngine
-from .engine.scoring_engine import ScoringEngine
-from .engine.optimizer import Optimizer
-from .geometry.polygon import create_polygon, create_rectangle, get_vertices
-from .data.equipment_catalog import EQUIPMENT_CATALOG, get_equipment_for_restaurant
+
+# 도메인/엔진/Shapely 스택은 무거우므로 각 명령 안에서 지연 import
+# (--help, validate 등은 시뮬레이션 엔진을 로드하지 않음)
+if TYPE_CHECKING:
+    from .schemas.output import SimulationOutput
 
 app = typer.Typer(help="식당 주방 설계 시뮬레이터")
 console = Console()
@@ -40,6 +28,10 @@ def simulate(
     seed: Optional[int] = typer.Option(None, "--seed", help="랜덤 시드"),
 ):
     """주방 레이아웃 시뮬레이션 실행"""
+    from rich.panel import Panel
+    from .domain.kitchen import Kitchen, KitchenShape, RestaurantType
+    from .engine.optimizer import Optimizer
+    from .schemas.input import KitchenInput
 
     # 입력 파일이 있으면 로드
     if input_file and input_file.exists():
@@ -113,6 +105,8 @@ def simulate(
 
 def _print_result(result, kitchen):
     """결과 테이블 출력"""
+    from rich.table import Table
+
     # 점수 테이블
     score_table = Table(title="점수 분석", show_header=True)
     score_table.add_column("항목", style="cyan")
@@ -152,8 +146,16 @@ def _print_result(result, kitchen):
     console.print(f"\n[dim]반복: {result.iterations_run}회, "
                   f"시간: {result.computation_time_ms:.0f}ms[/dim]")
 
-def _create_output(result, kitchen_input, kitchen) -> SimulationOutput:
+def _create_output(result, kitchen_input, kitchen) -> "SimulationOutput":
     """SimulationOutput 생성"""
+    from .data.equipment_catalog import EQUIPMENT_CATALOG
+    from .engine.validation_engine import ValidationEngine
+    from .geometry.polygon import create_polygon, create_rectangle
+    from .schemas.output import (
+        SimulationOutput, ZoneOutput, PlacementOutput,
+        ValidationResult, ScoreMetrics
+    )
+
     zones = [
         ZoneOutput(
             type=z.zone_type.value,
@@ -165,35 +167,38 @@ def _create_output(result, kitchen_input, kitchen) -> SimulationOutput:
         for z in result.best_zones
     ]
 
-    placements = []
+    # 배치 ID → 카탈로그 장비를 한 번만 해석해 출력/검증 루프에서 공유
+    get_equip = EQUIPMENT_CATALOG.get
+    resolved = []
     for p in result.best_placements.placements:
-        equip_id = p.equipment_id.rsplit("_", 1)[0]  # 인덱스 제거
-        equip = EQUIPMENT_CATALOG.get(equip_id)
+        base_id, sep, _ = p.equipment_id.rpartition("_")  # 인덱스 제거
+        equip = get_equip(base_id if sep else p.equipment_id)
         if equip:
-            placements.append(PlacementOutput(
-                equipment_id=p.equipment_id,
-                equipment_name=equip.name_ko,
-                zone=p.zone_type.value,
-                x=round(p.x, 2),
-                y=round(p.y, 2),
-                width=equip.width,
-                depth=equip.depth,
-                rotation=p.rotation,
-            ))
+            resolved.append((p, equip))
+
+    placements = []
+    for p, equip in resolved:
+        placements.append(PlacementOutput(
+            equipment_id=p.equipment_id,
+            equipment_name=equip.name_ko,
+            zone=p.zone_type.value,
+            x=round(p.x, 2),
+            y=round(p.y, 2),
+            width=equip.width,
+            depth=equip.depth,
+            rotation=p.rotation,
+        ))
 
     # 최종 결과에 대해 검증 재실행하여 실제 결과 포함
     zone_polys = {z.zone_type: create_polygon(z.polygon) for z in result.best_zones}
     # placement_polys 재구성
     placement_polys = {zt: [] for zt in zone_polys}
-    for p in result.best_placements.placements:
-        equip_id = p.equipment_id.rsplit("_", 1)[0]
-        equip = EQUIPMENT_CATALOG.get(equip_id)
-        if equip:
-            w = equip.depth if p.rotation == 90 else equip.width
-            h = equip.width if p.rotation == 90 else equip.depth
-            poly = create_rectangle(p.x, p.y, w, h)
-            if p.zone_type in placement_polys:
-                placement_polys[p.zone_type].append(poly)
+    for p, equip in resolved:
+        w = equip.depth if p.rotation == 90 else equip.width
+        h = equip.width if p.rotation == 90 else equip.depth
+        poly = create_rectangle(p.x, p.y, w, h)
+        if p.zone_type in placement_polys:
+            placement_polys[p.zone_type].append(poly)
 
     val_engine = ValidationEngine()
     _, violations = val_engine.validate_all(
@@ -240,6 +245,8 @@ def _create_output(result, kitchen_input, kitchen) -> SimulationOutput:
 @app.command()
 def validate(input_file: Path):
     """입력 JSON 파일 유효성 검사"""
+    from .schemas.input import KitchenInput
+
     try:
         with open(input_file, "r", encoding="utf-8") as f:
             data = json.load(f)
@@ -255,6 +262,9 @@ def validate(input_file: Path):
 @app.command()
 def equipment_list(restaurant_type: str = "casual"):
     """식당 유형별 기본 장비 목록 출력"""
+    from rich.table import Table
+    from .data.equipment_catalog import get_equipment_for_restaurant
+
     equipment = get_equipment_for_restaurant(restaurant_type)
 
     table = Table(title=f"{restaurant_type} 기본 장비", show_header=True)
@@ -1,11 +1,28 @@
 """C2 패턴 추출 엔진 - 396건 실데이터에서 배치 패턴 분석"""
 import json
+import math
 import re
+from bisect import bisect_right
 from collections import Counter, defaultdict
-from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+# orjson이 있으면 빠른 파서 사용, ijson이 있으면 스트리밍 로드 사용 가능 (선택 의존성)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from .models import (
     AreaBucket,
     BusinessTypePattern,
@@ -60,6 +77,24 @@ ZONE_NORMALIZATION = {
 }
 
 
+# 부분 매칭 키워드 (앞쪽이 우선)
+_ZONE_KEYWORDS = [
+    ("조리", "cooking"),
+    ("전처리", "preparation"),
+    ("준비", "preparation"),
+    ("작업", "preparation"),
+    ("세척", "washing"),
+    ("퇴식", "washing"),
+    ("저장", "storage"),
+    ("보관", "storage"),
+    ("배식", "serving"),
+    ("배선", "serving"),
+]
+# 키워드마다 그룹 하나인 단일 정규식 (키워드끼리 겹치는 부분이 없어 finditer로 전부 찾음)
+_ZONE_KEYWORD_RE = re.compile("|".join(f"({re.escape(k)})" for k, _ in _ZONE_KEYWORDS))
+
+
+@lru_cache(maxsize=4096)
 def normalize_zone_name(raw_name: str) -> str:
     """구역명 정규화"""
     if not raw_name:
@@ -71,246 +106,424 @@ def normalize_zone_name(raw_name: str) -> str:
     if cleaned in ZONE_NORMALIZATION:
         return ZONE_NORMALIZATION[cleaned]
 
-    # 부분 매칭
-    for keyword, normalized in [
-        ("조리", "cooking"),
-        ("전처리", "preparation"),
-        ("준비", "preparation"),
-        ("작업", "preparation"),
-        ("세척", "washing"),
-        ("퇴식", "washing"),
-        ("저장", "storage"),
-        ("보관", "storage"),
-        ("배식", "serving"),
-        ("배선", "serving"),
-    ]:
-        if keyword in cleaned:
-            return normalized
+    # 부분 매칭: 문자열 한 번 스캔 후 가장 우선순위 높은 키워드 선택
+    best = min((m.lastindex for m in _ZONE_KEYWORD_RE.finditer(cleaned)), default=None)
+    if best is not None:
+        return _ZONE_KEYWORDS[best - 1][1]
 
     return "other"
 
 
+# 이보다 케이스가 적으면 프로세스 풀 기동 비용이 더 커서 순차 처리
+_PARALLEL_MIN_CASES = 100
+
+# 면적 구간: 0-3, 3-5, 5-8, 8-12, 12-20, 20+ (평)
+AREA_BUCKETS = [
+    (0, 3), (3, 5), (5, 8), (8, 12), (12, 20), (20, 50),
+]
+_AREA_BUCKET_EDGES = [lo for lo, _ in AREA_BUCKETS] + [AREA_BUCKETS[-1][1]]
+
+
+@dataclass
+class _BusinessAccumulator:
+    """업종별 누적값"""
+    case_count: int = 0
+    areas: List[float] = field(default_factory=list)
+    total_equip: int = 0
+    equip: Counter = field(default_factory=Counter)   # (장비명, 카테고리) → 수량
+    cats: Counter = field(default_factory=Counter)    # 카테고리 → 수량
+    shapes: Counter = field(default_factory=Counter)  # 주방 형태 → 건수
+
+    def merge(self, other: "_BusinessAccumulator") -> None:
+        """뒤쪽 케이스 묶음의 누적값을 이어 붙임"""
+        self.case_count += other.case_count
+        self.areas.extend(other.areas)
+        self.total_equip += other.total_equip
+        self.equip.update(other.equip)
+        self.cats.update(other.cats)
+        self.shapes.update(other.shapes)
+
+
+@dataclass
+class _BucketAccumulator:
+    """면적 구간별 누적값"""
+    case_count: int = 0
+    equip_counts: List[int] = field(default_factory=list)
+    cats: Counter = field(default_factory=Counter)
+    names: Counter = field(default_factory=Counter)
+
+    def merge(self, other: "_BucketAccumulator") -> None:
+        """뒤쪽 케이스 묶음의 누적값을 이어 붙임"""
+        self.case_count += other.case_count
+        self.equip_counts.extend(other.equip_counts)
+        self.cats.update(other.cats)
+        self.names.update(other.names)
+
+
+@dataclass
+class _ZoneAccumulator:
+    """정규화 구역별 누적값"""
+    variants: set = field(default_factory=set)
+    count: int = 0
+    equip_counts: List[int] = field(default_factory=list)
+    item_names: Counter = field(default_factory=Counter)
+
+    def merge(self, other: "_ZoneAccumulator") -> None:
+        """뒤쪽 케이스 묶음의 누적값을 이어 붙임"""
+        self.variants |= other.variants
+        self.count += other.count
+        self.equip_counts.extend(other.equip_counts)
+        self.item_names.update(other.item_names)
+
+
+@dataclass
+class _CaseAccumulators:
+    """extract_all 단일 순회 누적값 묶음"""
+    total_equip: int = 0
+    by_biz: Dict[str, _BusinessAccumulator] = field(default_factory=dict)
+    buckets: List[_BucketAccumulator] = field(
+        default_factory=lambda: [_BucketAccumulator() for _ in AREA_BUCKETS]
+    )
+    case_categories: List[set] = field(default_factory=list)
+    zones: Dict[str, _ZoneAccumulator] = field(
+        default_factory=lambda: defaultdict(_ZoneAccumulator)
+    )
+    global_cats: Counter = field(default_factory=Counter)
+    # 장비명 → {카테고리: 건수} (삽입 순서 = 첫 등장 순) 및 현재 최다 카테고리
+    name_cats: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    name_best: Dict[str, str] = field(default_factory=dict)
+
+    def merge(self, other: "_CaseAccumulators") -> None:
+        """뒤쪽 케이스 묶음의 누적값을 이어 붙임
+
+        묶음 순서대로 병합하면 Counter/딕셔너리 삽입 순서와 리스트 순서가
+        전체를 한 번에 순회한 결과와 같다.
+        """
+        self.total_equip += other.total_equip
+        for biz, bp in other.by_biz.items():
+            if biz in self.by_biz:
+                self.by_biz[biz].merge(bp)
+            else:
+                self.by_biz[biz] = bp
+        for mine, theirs in zip(self.buckets, other.buckets):
+            mine.merge(theirs)
+        self.case_categories.extend(other.case_categories)
+        for zone, zd in other.zones.items():
+            if zone in self.zones:
+                self.zones[zone].merge(zd)
+            else:
+                self.zones[zone] = zd
+        self.global_cats.update(other.global_cats)
+        for name, counts in other.name_cats.items():
+            mine = self.name_cats.get(name)
+            if mine is None:
+                self.name_cats[name] = counts
+                self.name_best[name] = other.name_best[name]
+                continue
+            for cat, n in counts.items():
+                mine[cat] = mine.get(cat, 0) + n
+            # 동점이면 먼저 등장한 카테고리 (max는 첫 최댓값 반환)
+            self.name_best[name] = max(mine, key=mine.get)
+
+
+def _vote_category(acc: _CaseAccumulators, name: str, cat: str) -> None:
+    """장비명의 카테고리 득표 1건 반영 (최다 카테고리를 즉시 갱신)"""
+    counts = acc.name_cats.get(name)
+    if counts is None:
+        acc.name_cats[name] = {cat: 1}
+        acc.name_best[name] = cat
+        return
+
+    n = counts.get(cat, 0) + 1
+    counts[cat] = n
+    best = acc.name_best[name]
+    if best == cat:
+        return
+    best_n = counts[best]
+    # 동점이면 먼저 등장한 카테고리 유지 (Counter.most_common과 같은 규칙)
+    if n > best_n or (n == best_n and next(k for k in counts if k in (cat, best)) == cat):
+        acc.name_best[name] = cat
+
+
+def _accumulate_cases(cases: List[dict]) -> _CaseAccumulators:
+    """케이스 목록을 한 번만 순회하며 모든 통계의 누적값을 채움
+
+    카운터 삽입 순서(most_common 동점 순서)는 통계별로 따로 순회하던
+    방식과 같게 유지된다.
+    """
+    acc = _CaseAccumulators()
+    # 루프 안에서 반복 참조하는 누적 객체는 지역 변수로 바인딩
+    by_biz = acc.by_biz
+    buckets = acc.buckets
+    zones = acc.zones
+    global_cats = acc.global_cats
+    case_categories = acc.case_categories
+    n_buckets = len(AREA_BUCKETS)
+
+    for c in cases:
+        basic = c["basic_info"]
+        eq_list = c.get("equipment_list") or ()
+        n_eq = len(eq_list)
+        area = basic.get("kitchen_area_py")
+        acc.total_equip += n_eq
+
+        # 업종별
+        biz = basic.get("business_type_category") or "other"
+        bp = by_biz.get(biz)
+        if bp is None:
+            bp = by_biz[biz] = _BusinessAccumulator()
+        bp.case_count += 1
+        if area:
+            bp.areas.append(area)
+        bp.total_equip += n_eq
+        dims = c.get("kitchen_dimensions") or {}
+        bp.shapes[dims.get("shape_type") or "unknown"] += 1
+        biz_equip = bp.equip
+        biz_cats = bp.cats
+
+        # 면적 구간 (면적 없음/구간 밖이면 None)
+        bucket = None
+        if area is not None:
+            idx = bisect_right(_AREA_BUCKET_EDGES, area) - 1
+            if 0 <= idx < n_buckets:
+                bucket = buckets[idx]
+                bucket.case_count += 1
+                bucket.equip_counts.append(n_eq)
+
+        # 케이스 단위로 장비 필드를 모은 뒤 Counter.update로 일괄 집계
+        # (update는 순회 순서대로 더하므로 카운터 삽입 순서는 항목별 += 와 동일)
+        # category/business_type_category/shape_type은 실데이터에 null이 있으므로
+        # get(k, default)가 아니라 `or` 폴백을 유지
+        raw_cats = [eq.get("category") for eq in eq_list]
+        names = [eq.get("name") or "(unknown)" for eq in eq_list]
+        cat_list = [cat or "other" for cat in raw_cats]
+        qtys = [eq.get("quantity", 1) for eq in eq_list]
+
+        if all(qty == 1 for qty in qtys):
+            biz_equip.update(zip(names, cat_list))
+            biz_cats.update(cat_list)
+        else:
+            for name, cat, qty in zip(names, cat_list, qtys):
+                biz_equip[(name, cat)] += qty
+                biz_cats[cat] += qty
+        if bucket is not None:
+            bucket.cats.update(cat_list)
+            bucket.names.update(names)
+        global_cats.update(cat_list)
+        for name, cat in zip(names, cat_list):
+            _vote_category(acc, name, cat)
+
+        cats = {cat for cat in raw_cats if cat}
+        if cats:
+            case_categories.append(cats)
+
+        # 구역별 (장비명→카테고리는 전체 순회 후 확정되므로 장비명으로 집계)
+        for zone in c.get("zones") or ():
+            raw_zone = zone.get("zone_name", "(unknown)")
+            items = zone.get("equipment_items") or ()
+            zd = zones[normalize_zone_name(raw_zone)]
+            zd.variants.add(raw_zone)
+            zd.count += 1
+            zd.equip_counts.append(len(items))
+            zd.item_names.update(items)
+
+    return acc
+
+
 class PatternExtractor:
     """396건 실데이터에서 패턴 추출"""
 
-    def __init__(self, dataset_path: str):
+    def __init__(self, dataset_path: str, stream: bool = False):
+        """
+        Args:
+            dataset_path: dataset.json 경로
+            stream: True이고 ijson이 설치되어 있으면 cases 배열만 스트리밍 파싱
+                (파일 전체 문서를 메모리에 올리지 않음)
+        """
         self.dataset_path = Path(dataset_path)
+        self.stream = stream
         self.cases: List[dict] = []
         self._load_dataset()
 
     def _load_dataset(self):
         """dataset.json 로드"""
-        with open(self.dataset_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if self.stream and ijson is not None:
+            # 케이스 객체를 하나씩 읽어 누적 (float는 Decimal 대신 float로)
+            with open(self.dataset_path, "rb") as f:
+                self.cases = list(ijson.items(f, "cases.item", use_float=True))
+            return
+
+        if orjson is not None:
+            data = orjson.loads(self.dataset_path.read_bytes())
+        else:
+            with open(self.dataset_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         self.cases = data.get("cases", [])
 
-    def extract_all(self) -> PatternDatabase:
-        """전체 패턴 추출 실행"""
-        total_equip = sum(
-            len(c.get("equipment_list", [])) for c in self.cases
-        )
+    def extract_all(self, n_workers: int = 1) -> PatternDatabase:
+        """전체 패턴 추출 실행 (케이스 1회 순회 후 누적값에서 각 통계 도출)
+
+        Args:
+            n_workers: 누적 단계 병렬 프로세스 수 (1이면 순차)
+        """
+        acc = self._accumulate(n_workers)
+        name_to_cat = self._build_name_to_category_map(acc)
 
         db = PatternDatabase(
             total_cases=len(self.cases),
-            total_equipment_items=total_equip,
-            business_type_patterns=self._extract_business_type_patterns(),
-            co_occurrence_matrix=self._extract_co_occurrence(),
-            zone_equipment_mappings=self._extract_zone_mappings(),
-            area_patterns=self._extract_area_patterns(),
-            global_category_distribution=self._extract_global_category_dist(),
-            equipment_name_to_category=self._build_name_to_category_map(),
+            total_equipment_items=acc.total_equip,
+            business_type_patterns=self._extract_business_type_patterns(acc),
+            co_occurrence_matrix=self._extract_co_occurrence(acc),
+            zone_equipment_mappings=self._extract_zone_mappings(acc, name_to_cat),
+            area_patterns=self._extract_area_patterns(acc),
+            global_category_distribution=self._extract_global_category_dist(acc),
+            equipment_name_to_category=name_to_cat,
         )
         return db
 
-    def _extract_business_type_patterns(self) -> Dict[str, BusinessTypePattern]:
+    def _accumulate(self, n_workers: int = 1) -> _CaseAccumulators:
+        """self.cases 누적값 계산 (n_workers > 1이면 케이스 묶음별 병렬 후 순서대로 병합)"""
+        if n_workers > 1 and len(self.cases) >= _PARALLEL_MIN_CASES:
+            size = math.ceil(len(self.cases) / n_workers)
+            chunks = [self.cases[i:i + size] for i in range(0, len(self.cases), size)]
+            with ProcessPoolExecutor(n_workers) as ex:
+                partials = list(ex.map(_accumulate_cases, chunks))
+            acc = partials[0]
+            for part in partials[1:]:
+                acc.merge(part)
+            return acc
+        return _accumulate_cases(self.cases)
+
+    def _extract_business_type_patterns(
+        self, acc: "_CaseAccumulators"
+    ) -> Dict[str, BusinessTypePattern]:
         """업종별 패턴 추출"""
-        # 업종별 그룹핑
-        by_biz: Dict[str, List[dict]] = defaultdict(list)
-        for c in self.cases:
-            biz = c["basic_info"].get("business_type_category") or "other"
-            by_biz[biz].append(c)
-
         patterns = {}
-        for biz_type, cases in by_biz.items():
+        for biz_type, bp in acc.by_biz.items():
             # 평균 주방 면적
-            areas = [
-                c["basic_info"]["kitchen_area_py"]
-                for c in cases
-                if c["basic_info"].get("kitchen_area_py")
-            ]
-            avg_area = sum(areas) / len(areas) if areas else None
-
-            # 장비 빈도
-            equip_counter: Counter = Counter()
-            equip_cat_counter: Counter = Counter()
-            total_equip_count = 0
-            for c in cases:
-                eq_list = c.get("equipment_list", [])
-                total_equip_count += len(eq_list)
-                for eq in eq_list:
-                    name = eq.get("name") or "(unknown)"
-                    cat = eq.get("category") or "other"
-                    equip_counter[f"{name}|{cat}"] += eq.get("quantity", 1)
-                    equip_cat_counter[cat] += eq.get("quantity", 1)
-
-            avg_equip = total_equip_count / len(cases) if cases else 0
+            avg_area = sum(bp.areas) / len(bp.areas) if bp.areas else None
+            avg_equip = bp.total_equip / bp.case_count if bp.case_count else 0
 
             # 장비 빈도 리스트 (상위 30)
             freq_list = []
-            for key, cnt in equip_counter.most_common(30):
-                name, cat = key.rsplit("|", 1)
+            for (name, cat), cnt in bp.equip.most_common(30):
                 freq_list.append(EquipmentFrequency(
                     equipment_name=name,
                     category=cat,
                     count=cnt,
-                    ratio=round(cnt / len(cases), 3),
+                    ratio=round(cnt / bp.case_count, 3),
                 ))
 
             # 카테고리 분포
-            total_cat = sum(equip_cat_counter.values())
+            total_cat = sum(bp.cats.values())
             cat_dist = {
                 cat: round(cnt / total_cat, 3)
-                for cat, cnt in equip_cat_counter.most_common()
+                for cat, cnt in bp.cats.most_common()
             } if total_cat > 0 else {}
 
-            # 주방 형태 분포
-            shape_counter: Counter = Counter()
-            for c in cases:
-                dims = c.get("kitchen_dimensions") or {}
-                shape = dims.get("shape_type") or "unknown"
-                shape_counter[shape] += 1
-
             patterns[biz_type] = BusinessTypePattern(
                 business_type=biz_type,
-                case_count=len(cases),
+                case_count=bp.case_count,
                 avg_kitchen_area_py=round(avg_area, 1) if avg_area else None,
                 avg_equipment_count=round(avg_equip, 1),
                 equipment_frequencies=freq_list,
                 category_distribution=cat_dist,
-                common_shapes=dict(shape_counter.most_common()),
+                common_shapes=dict(bp.shapes.most_common()),
             )
 
         return patterns
 
-    def _extract_co_occurrence(self) -> List[CoOccurrenceEntry]:
+    def _extract_co_occurrence(self, acc: "_CaseAccumulators") -> List[CoOccurrenceEntry]:
         """장비 카테고리 공존 행렬 추출"""
         # 각 케이스에서 등장하는 카테고리 세트
-        case_categories: List[set] = []
-        for c in self.cases:
-            cats = set()
-            for eq in c.get("equipment_list", []):
-                cat = eq.get("category")
-                if cat:
-                    cats.add(cat)
-            if cats:
-                case_categories.append(cats)
-
-        # 모든 카테고리 쌍에 대해 공존 횟수 계산
+        case_categories = acc.case_categories
+
+        # 케이스 x 카테고리 0/1 행렬의 내적으로 모든 쌍의 공존 횟수를 한 번에 계산
         all_cats = sorted(set().union(*case_categories)) if case_categories else []
         total = len(case_categories)
-        entries = []
-
-        for cat_a, cat_b in combinations(all_cats, 2):
-            co_count = sum(
-                1 for cats in case_categories
-                if cat_a in cats and cat_b in cats
-            )
-            if co_count > 0:
-                entries.append(CoOccurrenceEntry(
-                    equipment_a=cat_a,
-                    equipment_b=cat_b,
-                    co_occurrence_count=co_count,
-                    co_occurrence_ratio=round(co_count / total, 3) if total > 0 else 0,
-                ))
+        if len(all_cats) < 2:
+            return []
+
+        cat_index = {cat: i for i, cat in enumerate(all_cats)}
+        rows = np.repeat(np.arange(total), [len(cats) for cats in case_categories])
+        cols = np.fromiter(
+            (cat_index[cat] for cats in case_categories for cat in cats),
+            dtype=np.intp, count=len(rows),
+        )
+        # 정수 행렬곱은 BLAS를 타지 않으므로 float64로 계산
+        # (횟수는 2**53 미만 정수라 정확히 표현됨)
+        presence = np.zeros((total, len(all_cats)), dtype=np.float64)
+        presence[rows, cols] = 1.0
+        co = presence.T @ presence
+
+        # 상삼각 (i < j)은 combinations(all_cats, 2)와 같은 순서
+        left, right = np.triu_indices(len(all_cats), k=1)
+        counts = co[left, right].astype(np.int64)
+        nonzero = np.flatnonzero(counts)
+        # 공존 횟수 내림차순 (동점은 쌍 순서 유지)
+        order = nonzero[np.argsort(-counts[nonzero], kind="stable")]
 
-        entries.sort(key=lambda e: e.co_occurrence_count, reverse=True)
+        entries = []
+        for k in order:
+            co_count = int(counts[k])
+            entries.append(CoOccurrenceEntry(
+                equipment_a=all_cats[left[k]],
+                equipment_b=all_cats[right[k]],
+                co_occurrence_count=co_count,
+                co_occurrence_ratio=round(co_count / total, 3),
+            ))
         return entries
 
-    def _extract_zone_mappings(self) -> List[ZoneEquipmentMapping]:
-        """구역-장비 매핑 통계"""
-        # 정규화된 구역별 통계
-        zone_data: Dict[str, dict] = defaultdict(lambda: {
-            "variants": set(),
-            "count": 0,
-            "equip_cats": Counter(),
-            "equip_counts": [],
-        })
-
-        # 장비명→카테고리 매핑 구축 (equipment_list에서)
-        name_to_cat = self._build_name_to_category_map()
-
-        for c in self.cases:
-            for zone in c.get("zones", []):
-                raw_name = zone.get("zone_name", "(unknown)")
-                normalized = normalize_zone_name(raw_name)
-                items = zone.get("equipment_items", [])
-
-                zd = zone_data[normalized]
-                zd["variants"].add(raw_name)
-                zd["count"] += 1
-                zd["equip_counts"].append(len(items))
-
-                for item_name in items:
-                    cat = name_to_cat.get(item_name, "other")
-                    zd["equip_cats"][cat] += 1
-
+    def _extract_zone_mappings(
+        self, acc: "_CaseAccumulators", name_to_cat: Dict[str, str]
+    ) -> List[ZoneEquipmentMapping]:
+        """구역-장비 매핑 통계 (name_to_cat: equipment_list 기준 장비명→카테고리)"""
+        category_of = name_to_cat.get
         mappings = []
-        for norm_name, zd in sorted(zone_data.items(), key=lambda x: x[1]["count"], reverse=True):
-            avg_eq = sum(zd["equip_counts"]) / len(zd["equip_counts"]) if zd["equip_counts"] else 0
+        # most_common은 C 수준 itemgetter로 정렬 (안정 정렬이라 동점 순서는 첫 등장 순 유지)
+        zone_counts = Counter({norm_name: zd.count for norm_name, zd in acc.zones.items()})
+        for norm_name, _ in zone_counts.most_common():
+            zd = acc.zones[norm_name]
+            # 장비명 첫 등장 순으로 카테고리에 합산 → 항목 순회와 같은 카운터 순서
+            equip_cats: Counter = Counter()
+            for item_name, cnt in zd.item_names.items():
+                equip_cats[category_of(item_name, "other")] += cnt
+
+            avg_eq = sum(zd.equip_counts) / len(zd.equip_counts) if zd.equip_counts else 0
             mappings.append(ZoneEquipmentMapping(
                 zone_name_normalized=norm_name,
-                zone_name_variants=sorted(zd["variants"]),
-                total_appearances=zd["count"],
-                equipment_frequencies=dict(zd["equip_cats"].most_common()),
+                zone_name_variants=sorted(zd.variants),
+                total_appearances=zd.count,
+                equipment_frequencies=dict(equip_cats.most_common()),
                 avg_equipment_count=round(avg_eq, 1),
             ))
 
         return mappings
 
-    def _extract_area_patterns(self) -> List[AreaBucket]:
+    def _extract_area_patterns(self, acc: "_CaseAccumulators") -> List[AreaBucket]:
         """면적 구간별 패턴 추출"""
-        # 면적 구간: 0-3, 3-5, 5-8, 8-12, 12-20, 20+ (평)
-        buckets_def = [
-            (0, 3), (3, 5), (5, 8), (8, 12), (12, 20), (20, 50),
-        ]
-
         buckets = []
-        for area_min, area_max in buckets_def:
-            bucket_cases = [
-                c for c in self.cases
-                if c["basic_info"].get("kitchen_area_py") is not None
-                and area_min <= c["basic_info"]["kitchen_area_py"] < area_max
-            ]
-
-            if not bucket_cases:
+        for (area_min, area_max), bucket in zip(AREA_BUCKETS, acc.buckets):
+            if not bucket.case_count:
                 continue
 
             # 평균 장비 수
-            equip_counts = [len(c.get("equipment_list", [])) for c in bucket_cases]
-            avg_equip = sum(equip_counts) / len(equip_counts)
+            avg_equip = sum(bucket.equip_counts) / len(bucket.equip_counts)
 
             # 카테고리 분포
-            cat_counter: Counter = Counter()
-            equip_name_counter: Counter = Counter()
-            for c in bucket_cases:
-                for eq in c.get("equipment_list", []):
-                    cat = eq.get("category") or "other"
-                    cat_counter[cat] += 1
-                    equip_name_counter[eq.get("name") or "(unknown)"] += 1
-
-            total_cat = sum(cat_counter.values())
+            total_cat = sum(bucket.cats.values())
             cat_dist = {
                 cat: round(cnt / total_cat, 3)
-                for cat, cnt in cat_counter.most_common()
+                for cat, cnt in bucket.cats.most_common()
             } if total_cat > 0 else {}
 
             # 상위 10 빈출 장비
-            common_equip = [name for name, _ in equip_name_counter.most_common(10)]
+            common_equip = [name for name, _ in bucket.names.most_common(10)]
 
             buckets.append(AreaBucket(
                 area_min_py=area_min,
                 area_max_py=area_max,
-                case_count=len(bucket_cases),
+                case_count=bucket.case_count,
                 avg_equipment_count=round(avg_equip, 1),
                 category_distribution=cat_dist,
                 common_equipment=common_equip,
@@ -318,14 +531,9 @@ class PatternExtractor:
 
         return buckets
 
-    def _extract_global_category_dist(self) -> Dict[str, float]:
+    def _extract_global_category_dist(self, acc: "_CaseAccumulators") -> Dict[str, float]:
         """전체 카테고리 분포"""
-        cat_counter: Counter = Counter()
-        for c in self.cases:
-            for eq in c.get("equipment_list", []):
-                cat = eq.get("category") or "other"
-                cat_counter[cat] += 1
-
+        cat_counter = acc.global_cats
         total = sum(cat_counter.values())
         if total == 0:
             return {}
@@ -334,20 +542,12 @@ class PatternExtractor:
             for cat, cnt in cat_counter.most_common()
         }
 
-    def _build_name_to_category_map(self) -> Dict[str, str]:
-        """장비명→카테고리 매핑 사전 구축 (다수결)"""
-        name_cats: Dict[str, Counter] = defaultdict(Counter)
-        for c in self.cases:
-            for eq in c.get("equipment_list", []):
-                name = eq.get("name") or "(unknown)"
-                cat = eq.get("category") or "other"
-                name_cats[name][cat] += 1
+    def _build_name_to_category_map(self, acc: "_CaseAccumulators") -> Dict[str, str]:
+        """장비명→카테고리 매핑 사전 (다수결, 동점은 먼저 나온 카테고리)
 
-        return {
-            name: cats.most_common(1)[0][0]
-            for name, cats in name_cats.items()
-            if cats
-        }
+        최다 카테고리는 누적 중에 갱신되어 있으므로 정렬 없이 복사만 한다.
+        """
+        return dict(acc.name_best)
 
     def save(self, db: PatternDatabase, output_path: str):
         """패턴 DB를 JSON으로 저장"""
@@ -1,15 +1,19 @@
 """C2 패턴 데이터 모델 - 추출된 패턴의 정형 구조"""
+from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 from typing import Dict, List, Optional
 from datetime import datetime
 
 
-class EquipmentFrequency(BaseModel):
+# 추출 중 대량 생성되는 항목은 검증 없는 slots 데이터클래스로 둔다
+# (PatternDatabase 로드 시에는 Pydantic이 데이터클래스 필드도 검증/변환)
+@dataclass(slots=True)
+class EquipmentFrequency:
     """업종별 장비 출현 빈도"""
-    equipment_name: str = Field(description="장비명")
-    category: str = Field(description="장비 카테고리")
-    count: int = Field(description="등장 횟수")
-    ratio: float = Field(description="해당 업종 내 등장 비율 (0~1)")
+    equipment_name: str  # 장비명
+    category: str        # 장비 카테고리
+    count: int           # 등장 횟수
+    ratio: float         # 해당 업종 내 등장 비율 (0~1)
 
 
 class BusinessTypePattern(BaseModel):
@@ -29,39 +33,38 @@ class BusinessTypePattern(BaseModel):
     )
 
 
-class CoOccurrenceEntry(BaseModel):
+@dataclass(slots=True)
+class CoOccurrenceEntry:
     """장비 공존 항목"""
-    equipment_a: str = Field(description="장비 A 카테고리")
-    equipment_b: str = Field(description="장비 B 카테고리")
-    co_occurrence_count: int = Field(description="함께 등장한 케이스 수")
-    co_occurrence_ratio: float = Field(description="공존 비율 (0~1)")
+    equipment_a: str           # 장비 A 카테고리
+    equipment_b: str           # 장비 B 카테고리
+    co_occurrence_count: int   # 함께 등장한 케이스 수
+    co_occurrence_ratio: float # 공존 비율 (0~1)
 
 
-class ZoneEquipmentMapping(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ZoneEquipmentMapping:
     """구역-장비 매핑 통계"""
-    zone_name_normalized: str = Field(description="정규화된 구역명")
-    zone_name_variants: List[str] = Field(
-        default_factory=list, description="원본 구역명 변형들"
-    )
-    total_appearances: int = Field(description="구역 등장 횟수")
-    equipment_frequencies: Dict[str, int] = Field(
-        default_factory=dict, description="구역 내 장비 카테고리별 빈도"
-    )
-    avg_equipment_count: float = Field(description="구역 내 평균 장비 수")
+    zone_name_normalized: str  # 정규화된 구역명
+    # 원본 구역명 변형들
+    zone_name_variants: List[str] = field(default_factory=list)
+    total_appearances: int     # 구역 등장 횟수
+    # 구역 내 장비 카테고리별 빈도
+    equipment_frequencies: Dict[str, int] = field(default_factory=dict)
+    avg_equipment_count: float # 구역 내 평균 장비 수
 
 
-class AreaBucket(BaseModel):
+@dataclass(slots=True)
+class AreaBucket:
     """면적 구간별 패턴"""
-    area_min_py: float = Field(description="면적 하한 (평)")
-    area_max_py: float = Field(description="면적 상한 (평)")
-    case_count: int = Field(description="케이스 수")
-    avg_equipment_count: float = Field(description="평균 장비 수")
-    category_distribution: Dict[str, float] = Field(
-        default_factory=dict, description="카테고리별 평균 비율"
-    )
-    common_equipment: List[str] = Field(
-        default_factory=list, description="빈출 장비 (상위 10)"
-    )
+    area_min_py: float         # 면적 하한 (평)
+    area_max_py: float         # 면적 상한 (평)
+    case_count: int            # 케이스 수
+    avg_equipment_count: float # 평균 장비 수
+    # 카테고리별 평균 비율
+    category_distribution: Dict[str, float] = field(default_factory=dict)
+    # 빈출 장비 (상위 10)
+    common_equipment: List[str] = field(default_factory=list)
 
 
 class PatternDatabase(BaseModel):
@@ -1,9 +1,12 @@
 """패턴 기반 데이터 제공자 - patterns.json을 엔진에 연결하는 브릿지"""
 import json
+from bisect import bisect_right
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
-from .models import PatternDatabase
+from .models import PatternDatabase, ZoneEquipmentMapping
 
 # 장비 카테고리 → 4구역 가중치 매핑
 # 냉장 장비는 저장구역과 조리구역에 분산 배치되므로 가중치로 분할
@@ -24,13 +27,71 @@ CATEGORY_TO_ZONE_WEIGHTS = {
 DEFAULT_PATTERNS_PATH = Path(__file__).parent.parent.parent.parent / "data" / "extracted" / "patterns.json"
 
 
+@lru_cache(maxsize=4)
+def _load_database(path: str) -> PatternDatabase:
+    """패턴 DB 로드 (프로세스 내 경로별 1회 파싱)
+
+    PatternProvider 인스턴스들이 같은 파싱 결과를 공유하므로
+    반환 객체는 읽기 전용으로 다룬다.
+    """
+    # 바이트를 그대로 넘기면 pydantic-core가 직접 파싱 (str 디코딩 단계 생략)
+    return PatternDatabase.model_validate_json(Path(path).read_bytes())
+
+
 class PatternProvider:
     """패턴 DB에서 데이터 기반 추천을 제공"""
 
     def __init__(self, patterns_path: Optional[str] = None):
         path = Path(patterns_path) if patterns_path else DEFAULT_PATTERNS_PATH
-        with open(path, "r", encoding="utf-8") as f:
-            self.db = PatternDatabase.model_validate_json(f.read())
+        self.db = _load_database(str(path))
+
+        # 면적 구간은 서로 겹치지 않으므로 하한 정렬 후 이분 탐색
+        self._area_buckets = sorted(self.db.area_patterns, key=lambda b: b.area_min_py)
+        self._area_mins = [b.area_min_py for b in self._area_buckets]
+
+        # DB는 로드 후 변하지 않으므로 업종별 결과는 생성 시 미리 계산
+        self._zone_ratios_by_bt: Dict[str, Dict[str, float]] = {
+            bt: self._compute_zone_ratios(bt) for bt in self.db.business_type_patterns
+        }
+        # 카테고리 분포는 읽기 전용 뷰로 반환 (호출마다 복사하지 않음)
+        self._category_dist_by_bt: Dict[str, Mapping[str, float]] = {
+            bt: MappingProxyType(pattern.category_distribution)
+            for bt, pattern in self.db.business_type_patterns.items()
+            if pattern.category_distribution
+        }
+        self._global_category_dist = MappingProxyType(self.db.global_category_distribution)
+        self._top_equipment_by_bt: Dict[str, List[Tuple[str, str, float]]] = {
+            bt: [(ef.equipment_name, ef.category, ef.ratio) for ef in pattern.equipment_frequencies]
+            for bt, pattern in self.db.business_type_patterns.items()
+        }
+        # 예상 장비 수는 (업종, 면적 구간)별로 조회 시 캐시
+        self._count_estimate_cache: Dict[Tuple[str, int], int] = {}
+
+    # 공존/구역 조회는 생성기 경로에서 쓰지 않으므로 첫 조회 시 인덱스 생성
+    # (선형 탐색과 같게 먼저 나온 항목 우선)
+    @cached_property
+    def _co_occ(self) -> Dict[Tuple[str, str], float]:
+        index: Dict[Tuple[str, str], float] = {}
+        for entry in self.db.co_occurrence_matrix:
+            index.setdefault((entry.equipment_a, entry.equipment_b), entry.co_occurrence_ratio)
+            index.setdefault((entry.equipment_b, entry.equipment_a), entry.co_occurrence_ratio)
+        return index
+
+    @cached_property
+    def _zone_map(self) -> Dict[str, ZoneEquipmentMapping]:
+        index: Dict[str, ZoneEquipmentMapping] = {}
+        for zm in self.db.zone_equipment_mappings:
+            index.setdefault(zm.zone_name_normalized, zm)
+        return index
+
+    def _area_bucket_index(self, kitchen_area_py: float) -> int:
+        """면적이 속한 구간 인덱스 (없으면 -1)"""
+        idx = bisect_right(self._area_mins, kitchen_area_py) - 1
+        if idx >= 0:
+            bucket = self._area_buckets[idx]
+            if bucket.area_min_py <= kitchen_area_py < bucket.area_max_py:
+                return idx
+        return -1
 
     def get_zone_ratios(self, business_type: str) -> Dict[str, float]:
         """업종별 데이터 기반 구역 비율 반환
@@ -40,6 +101,13 @@ class PatternProvider:
         Returns:
             {"storage": 0.20, "preparation": 0.25, "cooking": 0.35, "washing": 0.20}
         """
+        ratios = self._zone_ratios_by_bt.get(business_type)
+        if ratios is None:
+            return self._default_ratios()
+        return dict(ratios)
+
+    def _compute_zone_ratios(self, business_type: str) -> Dict[str, float]:
+        """카테고리 분포 → 4구역 비율 변환 (캐시 없이 계산)"""
         pattern = self.db.business_type_patterns.get(business_type)
         if not pattern or not pattern.category_distribution:
             return self._default_ratios()
@@ -83,12 +151,19 @@ class PatternProvider:
         self, business_type: str, kitchen_area_py: float
     ) -> int:
         """업종+면적 기반 예상 장비 수 반환"""
+        # 결과는 면적 자체가 아니라 면적 구간에만 의존하므로 구간 인덱스로 캐시
+        idx = self._area_bucket_index(kitchen_area_py)
+        key = (business_type, idx)
+        count = self._count_estimate_cache.get(key)
+        if count is None:
+            count = self._compute_count_estimate(business_type, idx)
+            self._count_estimate_cache[key] = count
+        return count
+
+    def _compute_count_estimate(self, business_type: str, bucket_idx: int) -> int:
+        """면적 구간 인덱스 + 업종 기반 예상 장비 수 계산"""
         # 면적 구간에서 기본 장비 수
-        area_count = None
-        for bucket in self.db.area_patterns:
-            if bucket.area_min_py <= kitchen_area_py < bucket.area_max_py:
-                area_count = bucket.avg_equipment_count
-                break
+        area_count = self._area_buckets[bucket_idx].avg_equipment_count if bucket_idx >= 0 else None
 
         # 업종 평균 장비 수
         biz_pattern = self.db.business_type_patterns.get(business_type)
@@ -101,12 +176,9 @@ class PatternProvider:
 
     def get_category_distribution(
         self, business_type: str
-    ) -> Dict[str, float]:
-        """업종별 장비 카테고리 분포 반환"""
-        pattern = self.db.business_type_patterns.get(business_type)
-        if pattern and pattern.category_distribution:
-            return dict(pattern.category_distribution)
-        return self.db.global_category_distribution
+    ) -> Mapping[str, float]:
+        """업종별 장비 카테고리 분포 반환 (읽기 전용, 수정하려면 dict()로 복사)"""
+        return self._category_dist_by_bt.get(business_type, self._global_category_dist)
 
     def get_top_equipment(
         self, business_type: str, top_n: int = 20
@@ -116,49 +188,47 @@ class PatternProvider:
         Returns:
             [(장비명, 카테고리, 출현비율), ...]
         """
-        pattern = self.db.business_type_patterns.get(business_type)
-        if not pattern:
+        # 미리 만든 튜플 리스트의 슬라이스 (새 리스트라 호출자가 수정해도 무방)
+        top = self._top_equipment_by_bt.get(business_type)
+        if top is None:
             return []
-
-        return [
-            (ef.equipment_name, ef.category, ef.ratio)
-            for ef in pattern.equipment_frequencies[:top_n]
-        ]
+        return top[:top_n]
 
     def get_co_occurrence_ratio(self, cat_a: str, cat_b: str) -> float:
         """두 카테고리의 공존 비율 반환"""
-        for entry in self.db.co_occurrence_matrix:
-            if (entry.equipment_a == cat_a and entry.equipment_b == cat_b) or \
-               (entry.equipment_a == cat_b and entry.equipment_b == cat_a):
-                return entry.co_occurrence_ratio
-        return 0.0
+        return self._co_occ.get((cat_a, cat_b), 0.0)
 
     def get_zone_equipment_stats(self, zone_name: str) -> Optional[dict]:
-        """구역별 장비 통계 반환"""
-        for zm in self.db.zone_equipment_mappings:
-            if zm.zone_name_normalized == zone_name:
-                return {
-                    "total_appearances": zm.total_appearances,
-                    "avg_equipment_count": zm.avg_equipment_count,
-                    "equipment_frequencies": zm.equipment_frequencies,
-                }
-        return None
+        """구역별 장비 통계 반환 (equipment_frequencies는 읽기 전용 뷰)"""
+        zm = self._zone_map.get(zone_name)
+        if zm is None:
+            return None
+        return {
+            "total_appearances": zm.total_appearances,
+            "avg_equipment_count": zm.avg_equipment_count,
+            "equipment_frequencies": MappingProxyType(zm.equipment_frequencies),
+        }
 
     def lookup_category(self, equipment_name: str) -> str:
         """장비명으로 카테고리 조회 (1,416개 사전 활용)"""
         return self.db.equipment_name_to_category.get(equipment_name, "other")
 
     def get_area_bucket(self, kitchen_area_py: float) -> Optional[dict]:
-        """면적 구간 패턴 반환"""
-        for bucket in self.db.area_patterns:
-            if bucket.area_min_py <= kitchen_area_py < bucket.area_max_py:
-                return {
-                    "case_count": bucket.case_count,
-                    "avg_equipment_count": bucket.avg_equipment_count,
-                    "category_distribution": bucket.category_distribution,
-                    "common_equipment": bucket.common_equipment,
-                }
-        return None
+        """면적 구간 패턴 반환
+
+        공유 DB를 보호하기 위해 category_distribution은 읽기 전용 뷰,
+        common_equipment는 튜플로 반환한다.
+        """
+        idx = self._area_bucket_index(kitchen_area_py)
+        if idx < 0:
+            return None
+        bucket = self._area_buckets[idx]
+        return {
+            "case_count": bucket.case_count,
+            "avg_equipment_count": bucket.avg_equipment_count,
+            "category_distribution": MappingProxyType(bucket.category_distribution),
+            "common_equipment": tuple(bucket.common_equipment),
+        }
 
     @staticmethod
     def _default_ratios() -> Dict[str, float]:
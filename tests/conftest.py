@@ -2,6 +2,15 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # src 경로 추가
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(scope="session")
+def pattern_provider():
+    """테스트 전체에서 공유하는 PatternProvider (읽기 전용으로 사용)"""
+    from kitchen_simulator.patterns.provider import PatternProvider
+    return PatternProvider()
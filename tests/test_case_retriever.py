@@ -0,0 +1,82 @@
+"""CaseRetriever 테스트"""
+import math
+from dataclasses import asdict
+
+import pytest
+from kitchen_simulator.generator.case_retriever import CaseRetriever
+
+
+@pytest.fixture(scope="module")
+def retriever():
+    return CaseRetriever()
+
+
+def reference_similarity(case, target_biz, target_area, target_shape):
+    """사례 딕셔너리에서 직접 계산하는 기준 유사도"""
+    basic = case.get("basic_info", {})
+    dims = case.get("kitchen_dimensions") or {}
+
+    score = 0.5 if basic.get("business_type_category", "") == target_biz else 0.1
+
+    case_area = basic.get("kitchen_area_py")
+    if case_area and case_area > 0:
+        area_ratio = abs(case_area - target_area) / max(target_area, 1)
+        score += 0.3 * math.exp(-(area_ratio ** 2) / (2 * 0.3 ** 2))
+
+    if target_shape:
+        case_shape = dims.get("shape_type", "")
+        if case_shape and case_shape.lower() == target_shape.lower():
+            score += 0.2
+    else:
+        score += 0.1
+
+    return score
+
+
+class TestCaseRetriever:
+    def test_find_similar_matches_scalar_similarity(self, retriever):
+        results = retriever.find_similar("korean", 10.0, "rectangle", top_k=5)
+
+        assert len(results) == 5
+        for sc in results:
+            expected = reference_similarity(
+                retriever._find_case(sc.case_number), "korean", 10.0, "rectangle"
+            )
+            assert sc.similarity_score == round(expected, 3)
+
+        scores = [sc.similarity_score for sc in results]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.parametrize("shape", ["rectangle", None])
+    def test_score_all_matches_reference_for_every_case(self, retriever, shape):
+        scores = retriever._score_all("korean", 10.0, shape)
+
+        expected = [reference_similarity(c, "korean", 10.0, shape) for c in retriever.cases]
+        assert scores.tolist() == pytest.approx(expected)
+
+    def test_find_similar_is_cached(self, retriever):
+        first = retriever.find_similar("cafe", 6.0, top_k=3)
+        second = retriever.find_similar("cafe", 6.0, top_k=3)
+
+        assert first == second
+        assert first is not second
+        assert retriever._find_similar_cached.cache_info().hits >= 1
+
+    def test_mutating_results_does_not_change_cache(self, retriever):
+        first = retriever.find_similar("korean", 10.0, top_k=3)
+        expected = [asdict(sc) for sc in first]
+
+        first[0].similarity_score = -1
+        first[0].equipment_names.append("없는 장비")
+        first[0].zone_names.clear()
+
+        again = retriever.find_similar("korean", 10.0, top_k=3)
+        assert [asdict(sc) for sc in again] == expected
+
+    def test_equipment_union_returns_fresh_dict(self, retriever):
+        cases = retriever.find_similar("chinese", 8.0, top_k=3)
+
+        union = retriever.get_equipment_union(cases)
+        union.clear()
+
+        assert retriever.get_equipment_union(cases)
@@ -0,0 +1,54 @@
+"""충돌 감지 유틸리티 테스트"""
+import pytest
+from shapely import affinity
+from shapely.geometry import Polygon, box
+from kitchen_simulator.geometry.collision import find_placement_candidates
+from kitchen_simulator.geometry.polygon import create_rectangle
+
+
+def brute_force_candidates(container, width, height, existing, clearance, step, gap):
+    """셀마다 Shapely로 직접 판정하는 기준 구현"""
+    minx, miny, maxx, maxy = container.bounds
+    inner = container.buffer(-clearance)
+    result = []
+    x = minx + clearance
+    while x + width <= maxx - clearance:
+        y = miny + clearance
+        while y + height <= maxy - clearance:
+            item = create_rectangle(x, y, width, height)
+            if inner.contains(item) and not any(
+                item.buffer(gap).intersects(p) for p in existing
+            ):
+                result.append((x, y))
+            y += step
+        x += step
+    return result
+
+
+class TestFindPlacementCandidates:
+    @pytest.mark.parametrize("container", [
+        box(0, 0, 6, 4),
+        Polygon([(0, 0), (6, 0), (6, 2), (3, 2), (3, 4), (0, 4)]),
+    ])
+    def test_matches_per_cell_shapely_checks(self, container):
+        existing = [
+            box(1.0, 0.15, 2.0, 0.8),
+            box(4.2, 1.0, 5.4, 1.65),
+            affinity.rotate(box(2.0, 2.5, 2.7, 3.0), 30),
+        ]
+
+        expected = brute_force_candidates(container, 1.2, 0.6, existing, 0.15, 0.2, 0.3)
+        actual = find_placement_candidates(
+            container, 1.2, 0.6, existing, clearance=0.15, grid_step=0.2, equip_clearance=0.3
+        )
+
+        assert actual == expected
+
+    def test_no_room_returns_empty(self):
+        assert find_placement_candidates(box(0, 0, 1, 1), 2.0, 2.0, []) == []
+
+    def test_rectangle_keeps_cells_exactly_at_wall_clearance(self):
+        # box(0, 0, 4, 3).buffer(-0.05)는 minx가 0.05보다 1ulp 큰 값으로 반올림됨
+        candidates = find_placement_candidates(box(0, 0, 4, 3), 1.0, 1.0, [], clearance=0.05)
+
+        assert (0.05, 0.05) in candidates
@@ -0,0 +1,74 @@
+"""Evaluator 테스트"""
+import pytest
+from kitchen_simulator.evaluation import Evaluator
+from kitchen_simulator.generator.equipment_generator import EquipmentGenerator
+from kitchen_simulator.generator.models import GeneratedEquipment, GenerationResult
+
+
+@pytest.fixture(scope="module")
+def batch():
+    results = []
+    for i, (biz, area) in enumerate([("korean", 10), ("cafe", 5), ("chinese", 15)]):
+        equipment, _ = EquipmentGenerator(seed=i).generate(biz, area)
+        gen_result = GenerationResult(
+            business_type=biz,
+            kitchen_area_py=area,
+            generated_equipment=equipment,
+        )
+        results.append((gen_result, 60.0 + i))
+    return results
+
+
+class TestEvaluator:
+    def test_batch_aggregates_by_business_type(self, batch):
+        report = Evaluator().evaluate_batch(batch)
+
+        assert report.total_evaluations == 3
+        assert sum(report.grade_distribution.values()) == 3
+        assert set(report.by_business_type) == {"korean", "cafe", "chinese"}
+
+    def test_parallel_batch_matches_serial(self, batch):
+        evaluator = Evaluator()
+
+        serial = evaluator.evaluate_batch(batch)
+        parallel = evaluator.evaluate_batch(batch, n_workers=2)
+
+        assert parallel.avg_final_score == serial.avg_final_score
+        assert [e.final_score for e in parallel.evaluations] == [
+            e.final_score for e in serial.evaluations
+        ]
+
+    def test_metrics_rounded_only_on_serialization(self, batch):
+        result = Evaluator().evaluate(*batch[0])
+        dumped = result.model_dump()
+
+        raw = result.avg_similarity.equipment_category_similarity
+        assert dumped["avg_similarity"]["equipment_category_similarity"] == round(raw, 3)
+        assert dumped["avg_similarity"]["overall_similarity"] == round(
+            result.avg_similarity.overall_similarity, 1
+        )
+
+    def test_unseen_names_do_not_grow_vocabulary(self, batch):
+        evaluator = Evaluator()
+        vocab_sizes = (len(evaluator._category_vocab), len(evaluator._name_vocab))
+        base = batch[0][0]
+        novel = GenerationResult(
+            business_type=base.business_type,
+            kitchen_area_py=base.kitchen_area_py,
+            generated_equipment=base.generated_equipment + [
+                GeneratedEquipment(equipment_name="처음 보는 장비", category="new_category",
+                                   confidence=0.5),
+            ],
+        )
+
+        result = evaluator.evaluate(novel)
+
+        assert (len(evaluator._category_vocab), len(evaluator._name_vocab)) == vocab_sizes
+        for comp in result.case_comparisons:
+            # 새 장비명은 어느 사례와도 겹치지 않고 합집합에만 포함
+            assert "처음 보는 장비" in comp.extra_equipment
+            union = (len(comp.matched_equipment) + len(comp.missing_equipment)
+                     + len(comp.extra_equipment))
+            assert comp.similarity_metrics.equipment_name_overlap == pytest.approx(
+                len(comp.matched_equipment) / union
+            )
@@ -0,0 +1,24 @@
+"""PatternExtractor 테스트"""
+import pytest
+from kitchen_simulator.generator.case_retriever import DEFAULT_DATASET_PATH
+from kitchen_simulator.patterns.extractor import PatternExtractor, normalize_zone_name
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return PatternExtractor(str(DEFAULT_DATASET_PATH))
+
+
+class TestPatternExtractor:
+    def test_parallel_extraction_matches_serial(self, extractor):
+        serial = extractor.extract_all()
+        parallel = extractor.extract_all(n_workers=3)
+
+        assert parallel.model_dump(exclude={"created_at"}) == serial.model_dump(
+            exclude={"created_at"}
+        )
+
+    def test_zone_keyword_priority_follows_keyword_order(self):
+        # 조리가 준비보다 앞선 키워드이므로 문자열 위치와 무관하게 cooking
+        assert normalize_zone_name("준비 겸 조리실") == "cooking"
+        assert normalize_zone_name("창고") == "other"
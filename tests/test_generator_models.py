@@ -0,0 +1,58 @@
+"""생성 결과 모델 테스트"""
+import json
+from dataclasses import fields
+
+import pytest
+
+from kitchen_simulator.generator.models import (
+    GeneratedEquipment,
+    GenerationResult,
+    SimilarCase,
+)
+
+
+class TestGenerationResult:
+    def test_to_dict_converts_nested_items(self):
+        result = GenerationResult(
+            business_type="korean",
+            kitchen_area_py=10.0,
+            similar_cases=[SimilarCase(
+                case_number=3, business_type="korean",
+                equipment_count=12, similarity_score=0.91,
+            )],
+            generated_equipment=[GeneratedEquipment(
+                equipment_name="냉장고", category="refrigeration", confidence=0.8,
+            )],
+            recommended_zone_ratios={"cooking": 0.4},
+        )
+
+        dumped = result.to_dict()
+
+        assert dumped["similar_cases"][0]["case_number"] == 3
+        assert dumped["generated_equipment"][0] == {
+            "equipment_name": "냉장고",
+            "category": "refrigeration",
+            "confidence": 0.8,
+            "quantity": 1,
+            "source": "pattern",
+            "catalog_id": None,
+        }
+        assert json.loads(json.dumps(dumped, ensure_ascii=False)) == dumped
+
+    def test_to_dict_copies_containers(self):
+        result = GenerationResult(business_type="cafe", kitchen_area_py=5.0)
+
+        result.to_dict()["recommended_zone_ratios"]["cooking"] = 1.0
+
+        assert result.recommended_zone_ratios == {}
+
+    def test_fields_keep_declared_order_and_are_keyword_only(self):
+        assert list(GenerationResult(business_type="cafe", kitchen_area_py=5.0).to_dict()) == [
+            "business_type", "kitchen_area_py", "similar_cases", "generated_equipment",
+            "recommended_zone_ratios", "generation_method", "pattern_coverage",
+        ]
+        assert [f.name for f in fields(GeneratedEquipment)] == [
+            "equipment_name", "category", "quantity", "confidence", "source", "catalog_id",
+        ]
+        with pytest.raises(TypeError):
+            GeneratedEquipment("냉장고", "refrigeration", 1, 0.8)
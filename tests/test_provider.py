@@ -0,0 +1,70 @@
+"""PatternProvider 테스트"""
+import pytest
+
+
+class TestPatternProvider:
+    def test_co_occurrence_lookup_is_order_independent(self, pattern_provider):
+        entry = pattern_provider.db.co_occurrence_matrix[0]
+
+        lookup = pattern_provider.get_co_occurrence_ratio
+
+        ratio = lookup(entry.equipment_a, entry.equipment_b)
+
+        assert ratio == entry.co_occurrence_ratio
+        assert lookup(entry.equipment_b, entry.equipment_a) == ratio
+        assert lookup("cooking", "no_such_category") == 0.0
+
+    @pytest.mark.parametrize("area", [0.0, 2.9, 3.0, 7.99, 12.0, 49.9, 50.0, -1.0])
+    def test_area_bucket_matches_linear_scan(self, pattern_provider, area):
+        expected = next(
+            (b for b in pattern_provider.db.area_patterns if b.area_min_py <= area < b.area_max_py),
+            None,
+        )
+
+        bucket = pattern_provider.get_area_bucket(area)
+
+        if expected is None:
+            assert bucket is None
+        else:
+            assert bucket["case_count"] == expected.case_count
+
+    def test_cached_zone_ratios_are_not_shared(self, pattern_provider):
+        first = pattern_provider.get_zone_ratios("korean")
+        first["cooking"] = 0.0
+
+        expected = pattern_provider._compute_zone_ratios("korean")
+        assert pattern_provider.get_zone_ratios("korean") == expected
+
+    def test_category_distribution_is_read_only(self, pattern_provider):
+        dist = pattern_provider.get_category_distribution("korean")
+
+        with pytest.raises(TypeError):
+            dist["cooking"] = 0.0
+        assert dict(pattern_provider.get_category_distribution("no_such_type")) == (
+            pattern_provider.db.global_category_distribution
+        )
+
+    def test_bucket_and_zone_stats_are_isolated_across_instances(self, pattern_provider):
+        from kitchen_simulator.patterns.provider import PatternProvider
+
+        area = pattern_provider.db.area_patterns[0].area_min_py
+        zone_name = pattern_provider.db.zone_equipment_mappings[0].zone_name_normalized
+        bucket = pattern_provider.get_area_bucket(area)
+        stats = pattern_provider.get_zone_equipment_stats(zone_name)
+        expected_bucket = (dict(bucket["category_distribution"]), list(bucket["common_equipment"]))
+        expected_freqs = dict(stats["equipment_frequencies"])
+
+        with pytest.raises(TypeError):
+            bucket["category_distribution"]["cooking"] = 0.0
+        with pytest.raises(AttributeError):
+            bucket["common_equipment"].append("없는 장비")
+        with pytest.raises(TypeError):
+            stats["equipment_frequencies"]["없는 장비"] = 1
+
+        other = PatternProvider()
+        other_bucket = other.get_area_bucket(area)
+        assert (dict(other_bucket["category_distribution"]),
+                list(other_bucket["common_equipment"])) == expected_bucket
+        assert dict(other.get_zone_equipment_stats(zone_name)["equipment_frequencies"]) == (
+            expected_freqs
+        )
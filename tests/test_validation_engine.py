@@ -0,0 +1,71 @@
+"""ValidationEngine 테스트"""
+from kitchen_simulator.domain.zone import Zone, ZoneType
+from kitchen_simulator.domain.equipment import EquipmentPlacement
+from kitchen_simulator.engine.validation_engine import ValidationEngine
+from kitchen_simulator.geometry.polygon import create_polygon, create_rectangle
+
+def create_test_layout(overlapping=False):
+    zones = [
+        Zone(zone_type=ZoneType.COOKING,
+             polygon=[(0, 0), (6, 0), (6, 4), (0, 4)], area=24.0),
+    ]
+    zone_polys = {z.zone_type: create_polygon(z.polygon) for z in zones}
+
+    # 첫 장비는 벽에 바짝 붙여 벽 이격 경고를 유발
+    second_x = 0.5 if overlapping else 2.5
+    placements = [
+        EquipmentPlacement("work_table_medium_0", ZoneType.COOKING, 0.05, 1.0),
+        EquipmentPlacement("work_table_medium_1", ZoneType.COOKING, second_x, 1.0),
+    ]
+    placement_polys = {
+        ZoneType.COOKING: [
+            create_rectangle(p.x, p.y, 1.0, 0.65) for p in placements
+        ]
+    }
+    return zones, placements, zone_polys, placement_polys
+
+class TestValidationEngine:
+    def test_overlapping_equipment_fails(self):
+        engine = ValidationEngine()
+        passed, violations = engine.validate_all(*create_test_layout(overlapping=True))
+
+        assert not passed
+        assert any(v.message == "장비가 서로 겹칩니다" for v in violations)
+
+    def test_fast_fail_stops_after_first_error(self):
+        layout = create_test_layout(overlapping=True)
+
+        full_passed, full_violations = ValidationEngine().validate_all(*layout)
+        fast_passed, fast_violations = ValidationEngine().validate_all(*layout, fast_fail=True)
+
+        assert fast_passed == full_passed
+        assert any(v.severity == "error" for v in fast_violations)
+        assert len(fast_violations) < len(full_violations)
+
+    def test_fast_fail_matches_full_run_when_passing(self):
+        layout = create_test_layout()
+
+        full_passed, full_violations = ValidationEngine().validate_all(*layout)
+        fast_passed, fast_violations = ValidationEngine().validate_all(*layout, fast_fail=True)
+
+        assert full_passed and fast_passed
+        assert fast_violations == full_violations
+
+    def test_summary_groups_messages_by_severity(self):
+        engine = ValidationEngine()
+        engine.validate_all(*create_test_layout(overlapping=True))
+        summary = engine.get_summary()
+
+        assert not summary["passed"]
+        assert summary["error_count"] == len(summary["errors"])
+        assert summary["warning_count"] == len(summary["warnings"])
+        assert summary["info_count"] == len(summary["infos"])
+
+    def test_collect_messages_off_keeps_severities(self):
+        layout = create_test_layout(overlapping=True)
+
+        _, full_violations = ValidationEngine().validate_all(*layout)
+        _, bare_violations = ValidationEngine(collect_messages=False).validate_all(*layout)
+
+        assert [v.severity for v in bare_violations] == [v.severity for v in full_violations]
+        assert all(v.message == "" for v in bare_violations)
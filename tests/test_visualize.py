@@ -0,0 +1,88 @@
+"""시각화 스크립트 테스트"""
+import json
+
+import pytest
+
+pytest.importorskip("matplotlib")
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+import visualize  # noqa: E402
+
+# 한글 폰트가 없는 환경에서는 제목 글리프 누락 경고가 나므로 무시
+pytestmark = pytest.mark.filterwarnings("ignore:Glyph .* missing from font")
+
+
+def write_sim(directory, name):
+    """최소 시뮬레이션 결과 JSON (구역 1개, 장비 1개)"""
+    data = {
+        "zones": [{"type": "cooking", "polygon": [[0, 0], [4, 0], [4, 3], [0, 3]]}],
+        "placements": [{"equipment_id": "griddle_0", "zone": "cooking",
+                        "x": 0.5, "y": 0.5, "rotation": 0}],
+    }
+    (directory / name).write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def sim_dir(tmp_path):
+    directory = tmp_path / "sims"
+    directory.mkdir()
+    for i in range(3):
+        write_sim(directory, f"sim_{i:03d}.json")
+    return directory
+
+
+class TestVisualizeGrid:
+    @pytest.mark.parametrize("suffix, mosaic", [
+        (".png", True),
+        (".JPG", True),
+        (".webp", True),
+        (".svg", False),
+        (".pdf", False),
+    ])
+    def test_output_suffix_selects_save_path(self, sim_dir, tmp_path, monkeypatch,
+                                             suffix, mosaic):
+        calls = []
+        original = visualize._save_grid_mosaic
+
+        def recording_mosaic(*args):
+            calls.append(args)
+            original(*args)
+
+        monkeypatch.setattr(visualize, "_save_grid_mosaic", recording_mosaic)
+        output = tmp_path / f"grid{suffix}"
+
+        visualize.visualize_grid(sim_dir, str(output), cols=2)
+
+        assert bool(calls) == mosaic
+        assert output.stat().st_size > 0
+
+    def test_vector_output_is_written_by_matplotlib(self, sim_dir, tmp_path):
+        svg = tmp_path / "grid.svg"
+        pdf = tmp_path / "grid.pdf"
+
+        visualize.visualize_grid(sim_dir, str(svg), cols=2)
+        visualize.visualize_grid(sim_dir, str(pdf), cols=2)
+
+        assert "<svg" in svg.read_text(encoding="utf-8")
+        assert pdf.read_bytes().startswith(b"%PDF")
+
+    @pytest.mark.parametrize("suffix, target", [
+        (".png", "_render_title_bar"),
+        (".svg", "suptitle"),
+    ])
+    def test_title_reports_number_of_results(self, sim_dir, tmp_path, monkeypatch,
+                                             suffix, target):
+        titles = []
+        owner = visualize if target == "_render_title_bar" else visualize.plt
+        original = getattr(owner, target)
+
+        def recording_title(text, *args, **kwargs):
+            titles.append(text)
+            return original(text, *args, **kwargs)
+
+        monkeypatch.setattr(owner, target, recording_title)
+
+        visualize.visualize_grid(sim_dir, str(tmp_path / f"grid{suffix}"), cols=2)
+
+        assert titles == ["주방 레이아웃 시뮬레이션 결과 (3개)"]
@@ -1,14 +1,29 @@
 """주방 레이아웃 선 도면 시각화"""
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+# orjson이 있으면 빠른 파서 사용 (선택 의존성)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # matplotlib 설치 확인
 try:
     import matplotlib.pyplot as plt
     import matplotlib.patches as patches
-    from matplotlib.patches import Rectangle, FancyBboxPatch
+    from matplotlib.patches import FancyBboxPatch
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
     import matplotlib.font_manager as fm
+    from PIL import Image  # matplotlib 의존성으로 함께 설치됨
 except ImportError:
     print("matplotlib 설치 필요: pip install matplotlib")
     sys.exit(1)
@@ -41,16 +56,19 @@ ZONE_NAMES = {
     "washing": "세척",
 }
 
+# 구역 표기 순서 (장비 번호 부여 순서)
+ZONE_ORDER_INDEX = {"storage": 0, "preparation": 1, "cooking": 2, "washing": 3}
+
 # 장비 카탈로그 (크기 정보) - 카탈로그에서 자동 import, 실패 시 fallback
 try:
     from src.kitchen_simulator.data.equipment_catalog import EQUIPMENT_CATALOG
-    EQUIPMENT_SIZES = {
+    _sizes = {
         eq_id: (eq.width, eq.depth)
         for eq_id, eq in EQUIPMENT_CATALOG.items()
     }
 except ImportError:
     # fallback: 카탈로그 import 실패 시 하드코딩
-    EQUIPMENT_SIZES = {
+    _sizes = {
         # 선반류
         "wall_shelf": (1.19, 0.35),
         "overhead_shelf": (1.31, 0.37),
@@ -95,28 +113,44 @@ except ImportError:
         "hand_wash_sink": (0.4, 0.35),
     }
 
+# get_equipment_size 결과를 캐시하므로 크기 표는 읽기 전용으로 고정
+EQUIPMENT_SIZES = MappingProxyType(_sizes)
+
+def load_simulation(json_path):
+    """시뮬레이션 결과 JSON 로드 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(Path(json_path).read_bytes())
+    with open(json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=512)
 def get_equipment_size(equipment_id):
-    """장비 ID에서 크기 추출"""
+    """장비 ID에서 크기 추출 (그리드 뷰에서 같은 ID가 반복되므로 캐시)"""
     # ID에서 숫자 인덱스 제거 (예: work_table_large_0 -> work_table_large)
-    base_id = "_".join(equipment_id.rsplit("_", 1)[:-1]) if equipment_id[-1].isdigit() else equipment_id
+    base_id, sep, index = equipment_id.rpartition("_")
+    if not (sep and index.isdigit()):
+        base_id = equipment_id
     return EQUIPMENT_SIZES.get(base_id, (0.5, 0.5))
 
-def draw_layout(data, ax, title=None):
-    """단일 레이아웃 그리기 (번호 표기)"""
+def draw_layout(data, ax, title=None, detail="full"):
+    """단일 레이아웃 그리기 (번호 표기)
 
-    # 전체 주방 경계 계산
-    all_x = []
-    all_y = []
-    for zone in data.get("zones", []):
-        for x, y in zone["polygon"]:
-            all_x.append(x)
-            all_y.append(y)
+    Args:
+        detail: "full"이면 구역 라벨/장비 번호/그리드/축 표기 포함,
+            "compact"이면 썸네일용으로 도형만 그림 (텍스트 렌더링 생략)
+    """
+    full = detail == "full"
 
-    if not all_x:
+    # 전체 주방 경계 계산 (구역별 꼭짓점 배열은 라벨 위치 계산에 재사용)
+    zones = [z for z in data.get("zones", []) if z["polygon"]]
+    if not zones:
         return []
 
-    min_x, max_x = min(all_x), max(all_x)
-    min_y, max_y = min(all_y), max(all_y)
+    zone_pts = [np.asarray(z["polygon"], dtype=np.float64) for z in zones]
+    all_pts = np.concatenate(zone_pts)
+    min_x, min_y = all_pts.min(axis=0)
+    max_x, max_y = all_pts.max(axis=0)
     width = max_x - min_x
     height = max_y - min_y
 
@@ -125,38 +159,39 @@ def draw_layout(data, ax, title=None):
     ax.set_xlim(min_x - margin, max_x + margin)
     ax.set_ylim(min_y - margin, max_y + margin)
 
-    # 1. 구역 그리기
-    for zone in data.get("zones", []):
-        zone_type = zone["type"]
-        polygon = zone["polygon"]
-
-        # 폴리곤 닫기
-        xs = [p[0] for p in polygon] + [polygon[0][0]]
-        ys = [p[1] for p in polygon] + [polygon[0][1]]
+    # 1. 구역 그리기 (채우기/테두리를 각각 컬렉션 하나로 추가)
+    zone_fill_colors = [ZONE_COLORS.get(z["type"], "#EEEEEE") for z in zones]
+    ax.add_collection(PolyCollection(
+        zone_pts,
+        facecolors=zone_fill_colors, edgecolors=zone_fill_colors, alpha=0.5,
+    ))
+    # 테두리 (폴리곤 닫기)
+    ax.add_collection(LineCollection(
+        [np.vstack([pts, pts[:1]]) for pts in zone_pts],
+        colors=[ZONE_EDGE_COLORS.get(z["type"], "#666666") for z in zones],
+        linewidths=2, linestyles="-", zorder=2,
+    ))
 
-        # 채우기
-        ax.fill(xs, ys, color=ZONE_COLORS.get(zone_type, "#EEEEEE"), alpha=0.5)
-        # 테두리
-        ax.plot(xs, ys, color=ZONE_EDGE_COLORS.get(zone_type, "#666666"),
-                linewidth=2, linestyle="-")
+    for zone, pts in zip(zones if full else (), zone_pts):
+        zone_type = zone["type"]
 
         # 구역 라벨
-        cx = sum(p[0] for p in polygon) / len(polygon)
-        cy = sum(p[1] for p in polygon) / len(polygon)
+        cx, cy = pts.mean(axis=0)
         zone_name = ZONE_NAMES.get(zone_type, zone_type)
         ax.text(cx, cy, f"{zone_name}\n{zone.get('area_sqm', 0):.1f}㎡",
                 ha='center', va='center', fontsize=9, fontweight='bold',
                 color=ZONE_EDGE_COLORS.get(zone_type, "#333333"), alpha=0.5)
 
     # 2. 장비를 구역 순서대로 정렬 후 번호 부여
-    zone_order = ["storage", "preparation", "cooking", "washing"]
     placements = data.get("placements", [])
     sorted_placements = sorted(placements, key=lambda p: (
-        zone_order.index(p.get("zone", "")) if p.get("zone", "") in zone_order else 99,
+        ZONE_ORDER_INDEX.get(p.get("zone", ""), 99),
         p.get("x", 0), p.get("y", 0)
     ))
 
     equipment_list = []
+    rect_boxes = []
+    rect_colors = []
     for idx, placement in enumerate(sorted_placements, 1):
         x = placement["x"]
         y = placement["y"]
@@ -172,20 +207,16 @@ def draw_layout(data, ax, title=None):
         # 구역 색상으로 장비 채우기
         zone_color = ZONE_EDGE_COLORS.get(zone_type, "#666666")
 
-        # 장비 사각형
-        rect = Rectangle((x, y), w, h,
-                         linewidth=1.5,
-                         edgecolor=zone_color,
-                         facecolor='white',
-                         linestyle='-',
-                         zorder=3)
-        ax.add_patch(rect)
+        # 장비 사각형 (루프 후 컬렉션 하나로 추가)
+        rect_boxes.append((x, y, w, h))
+        rect_colors.append(zone_color)
 
         # 번호 표기 (장비 중앙)
-        fontsize = 7 if min(w, h) >= 0.5 else 5.5
-        ax.text(x + w/2, y + h/2, str(idx),
-                ha='center', va='center', fontsize=fontsize,
-                color=zone_color, fontweight='bold', zorder=4)
+        if full:
+            fontsize = 7 if min(w, h) >= 0.5 else 5.5
+            ax.text(x + w/2, y + h/2, str(idx),
+                    ha='center', va='center', fontsize=fontsize,
+                    color=zone_color, fontweight='bold', zorder=4)
 
         # 리스트용 데이터 수집
         equipment_list.append({
@@ -196,11 +227,27 @@ def draw_layout(data, ax, title=None):
             "zone_type": zone_type,
         })
 
+    if rect_boxes:
+        x0, y0, ws, hs = np.asarray(rect_boxes, dtype=np.float64).T
+        x1, y1 = x0 + ws, y0 + hs
+        corners = np.stack([
+            np.column_stack([x0, y0]), np.column_stack([x1, y0]),
+            np.column_stack([x1, y1]), np.column_stack([x0, y1]),
+        ], axis=1)
+        ax.add_collection(PolyCollection(
+            corners, facecolors='white', edgecolors=rect_colors,
+            linewidths=1.5, linestyles='-', zorder=3,
+        ))
+
     # 3. 그리드 및 축
     ax.set_aspect('equal')
-    ax.grid(True, linestyle='--', alpha=0.3)
-    ax.set_xlabel('X (m)', fontsize=8)
-    ax.set_ylabel('Y (m)', fontsize=8)
+    if full:
+        ax.grid(True, linestyle='--', alpha=0.3)
+        ax.set_xlabel('X (m)', fontsize=8)
+        ax.set_ylabel('Y (m)', fontsize=8)
+    else:
+        ax.set_xticks([])
+        ax.set_yticks([])
 
     # 제목
     if title:
@@ -218,10 +265,7 @@ def _draw_equipment_table(equipment_list, title_text, output_path):
     zone_order = ["storage", "preparation", "cooking", "washing"]
     grouped = {}
     for eq in equipment_list:
-        zt = eq["zone_type"]
-        if zt not in grouped:
-            grouped[zt] = []
-        grouped[zt].append(eq)
+        grouped.setdefault(eq["zone_type"], []).append(eq)
 
     # 테이블 데이터 구성
     col_labels = ["No.", "설비명", "구역", "크기(mm)"]
@@ -231,7 +275,8 @@ def _draw_equipment_table(equipment_list, title_text, output_path):
     for zt in zone_order:
         if zt not in grouped:
             continue
-        zone_color = ZONE_COLORS.get(zt, "#FFFFFF")
+        # 같은 구역의 행은 색상 행 하나를 공유 (table은 읽기만 함)
+        zone_row = [ZONE_COLORS.get(zt, "#FFFFFF")] * 4
         for eq in grouped[zt]:
             table_data.append([
                 str(eq["num"]),
@@ -239,7 +284,7 @@ def _draw_equipment_table(equipment_list, title_text, output_path):
                 eq["zone"],
                 eq["size"],
             ])
-            cell_colors.append([zone_color] * 4)
+        cell_colors.extend([zone_row] * len(grouped[zt]))
 
     n_rows = len(table_data)
     fig_height = max(3, 1.0 + n_rows * 0.35)
@@ -247,11 +292,14 @@ def _draw_equipment_table(equipment_list, title_text, output_path):
     ax.axis('off')
     ax.set_title(title_text, fontsize=11, fontweight='bold', pad=12)
 
+    # 열 너비는 셀 생성 시 지정 (생성 후 셀마다 set_width 하지 않음)
+    col_widths = [0.08, 0.38, 0.14, 0.20]
     table = ax.table(
         cellText=table_data,
         colLabels=col_labels,
         cellColours=cell_colors,
         colColours=["#E0E0E0"] * 4,
+        colWidths=col_widths,
         cellLoc='center',
         loc='center',
     )
@@ -263,12 +311,6 @@ def _draw_equipment_table(equipment_list, title_text, output_path):
     for j in range(len(col_labels)):
         table[0, j].set_text_props(fontweight='bold', fontsize=9)
 
-    # 열 너비 조정
-    col_widths = [0.08, 0.38, 0.14, 0.20]
-    for j, w in enumerate(col_widths):
-        for i in range(n_rows + 1):
-            table[i, j].set_width(w)
-
     plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
     print(f"저장됨: {output_path}")
     plt.close()
@@ -276,8 +318,7 @@ def _draw_equipment_table(equipment_list, title_text, output_path):
 
 def visualize_single(json_path, output_path=None):
     """단일 시뮬레이션 시각화 (도면 + 설비 리스트 별도 파일)"""
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_simulation(json_path)
 
     # 점수 정보
     scores = data.get("scores", {})
@@ -315,34 +356,132 @@ def visualize_single(json_path, output_path=None):
     _draw_equipment_table(equipment_list, list_title, list_path)
 
 
-def visualize_grid(json_dir, output_path=None, cols=4):
-    """여러 시뮬레이션 그리드 시각화"""
-    json_files = sorted(Path(json_dir).glob("sim_*.json"))
+# 그리드 셀 하나의 크기 (인치)와 래스터 해상도
+GRID_CELL_SIZE = (4, 3.5)
+GRID_DPI = 100
+
+# 셀 이미지를 PIL로 합성해 저장하는 래스터 확장자 (그 외 PDF/SVG 등은 matplotlib로 저장)
+GRID_MOSAIC_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+
+
+# (figsize, dpi) → 재사용할 셀 Figure (작업 프로세스마다 하나씩 생성)
+_FIG_CACHE = {}
+
+
+def _cell_figure(figsize, dpi):
+    """셀 렌더링용 Figure 반환 (캐시된 것이 있으면 비워서 재사용)"""
+    key = (figsize, dpi)
+    fig = _FIG_CACHE.get(key)
+    if fig is None:
+        fig = _FIG_CACHE[key] = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+    else:
+        fig.clf()
+    # 틱/텍스트가 없는 썸네일이므로 고정 여백 사용 (tight_layout 계산 생략,
+    # clf()가 여백 설정도 초기화하므로 매번 지정)
+    fig.subplots_adjust(left=0.04, right=0.96, bottom=0.04, top=0.96)
+    return fig
+
+
+def _render_one(json_path):
+    """그리드 셀 하나를 Agg 캔버스에 그려 RGBA 배열로 반환 (프로세스 풀 작업 단위)"""
+    data = load_simulation(json_path)
+
+    fig = _cell_figure(GRID_CELL_SIZE, GRID_DPI)
+    draw_layout(data, fig.subplots(), detail="compact")
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+def _render_tile(json_path):
+    """그리드 셀 하나를 PIL 이미지로 렌더링 (프로세스 풀 작업 단위)"""
+    return Image.fromarray(_render_one(json_path))
+
+
+def _render_title_bar(text, width_px):
+    """그리드 상단 제목 띠를 PIL 이미지로 렌더링"""
+    fig = Figure(figsize=(width_px / GRID_DPI, 0.5), dpi=GRID_DPI)
+    FigureCanvasAgg(fig)
+    fig.text(0.5, 0.5, text, ha='center', va='center', fontsize=14, fontweight='bold')
+    fig.canvas.draw()
+    return Image.frombytes('RGBA', fig.canvas.get_width_height(), fig.canvas.buffer_rgba())
+
+
+def _save_grid_mosaic(json_files, output_path, cols, n_workers):
+    """셀 이미지를 따로 렌더링해 PIL 캔버스에 붙여 저장 (격자 Axes를 만들지 않음)"""
+    if n_workers > 1 and len(json_files) > 1:
+        with ProcessPoolExecutor(n_workers) as ex:
+            tiles = list(ex.map(_render_tile, json_files))
+    else:
+        tiles = [_render_tile(p) for p in json_files]
+
+    w, h = tiles[0].size
+    rows = (len(tiles) + cols - 1) // cols
+    title = _render_title_bar(f"주방 레이아웃 시뮬레이션 결과 ({len(json_files)}개)", cols * w)
+
+    out = Image.new('RGB', (cols * w, title.height + rows * h), 'white')
+    out.paste(title, (0, 0))
+    for i, tile in enumerate(tiles):
+        row, col = divmod(i, cols)
+        out.paste(tile, (col * w, title.height + row * h))
+    out.save(output_path)
+
+
+def visualize_grid(json_dir, output_path=None, cols=4, n_workers=1):
+    """여러 시뮬레이션 그리드 시각화
+
+    Args:
+        output_path: 저장 경로 (래스터 확장자면 셀 이미지를 PIL로 합성해 저장,
+            PDF/SVG 등은 한 Figure에 격자로 그려 저장, 없으면 화면에 표시)
+        n_workers: 셀 렌더링 프로세스 수 (2 이상이면 셀을 병렬 렌더링)
+    """
+    # glob 패턴 매칭 대신 이름 접두/접미 비교로 필터 (대량 디렉토리 대응)
+    json_files = sorted(
+        p for p in Path(json_dir).iterdir()
+        if p.name.startswith("sim_") and p.name.endswith(".json")
+    )
 
     if not json_files:
         print("시뮬레이션 파일이 없습니다.")
         return
 
+    if output_path and Path(output_path).suffix.lower() in GRID_MOSAIC_SUFFIXES:
+        _save_grid_mosaic(json_files, output_path, cols, n_workers)
+        print(f"저장됨: {output_path}")
+        return
+
     n = len(json_files)
     rows = (n + cols - 1) // cols
 
-    fig, axes = plt.subplots(rows, cols, figsize=(cols * 4, rows * 3.5))
+    # 셀은 틱/텍스트가 없는 썸네일이므로 고정 간격으로 배치 (tight_layout 계산 생략)
+    fig_height = rows * GRID_CELL_SIZE[1]
+    fig, axes = plt.subplots(
+        rows, cols, figsize=(cols * GRID_CELL_SIZE[0], fig_height),
+        gridspec_kw=dict(left=0.02, right=0.98, bottom=0.02, top=1 - 0.5 / fig_height,
+                         wspace=0.08, hspace=0.08),
+    )
     axes = axes.flatten() if n > 1 else [axes]
 
-    for i, json_file in enumerate(json_files):
-        with open(json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        draw_layout(data, axes[i])
+    if n_workers > 1 and n > 1:
+        # 셀마다 독립적이므로 프로세스 풀로 렌더링 (입력 순서 유지)
+        with ProcessPoolExecutor(n_workers) as ex:
+            images = list(ex.map(_render_one, json_files))
+        for ax, image in zip(axes, images):
+            ax.imshow(image)
+            ax.axis('off')
+    else:
+        for i, json_file in enumerate(json_files):
+            data = load_simulation(json_file)
+            draw_layout(data, axes[i], detail="compact")
 
     # 빈 축 숨기기
     for i in range(n, len(axes)):
         axes[i].axis('off')
 
-    plt.suptitle("주방 레이아웃 시뮬레이션 결과 (20개)", fontsize=14, fontweight='bold')
-    plt.tight_layout()
+    plt.suptitle(f"주방 레이아웃 시뮬레이션 결과 ({n}개)", fontsize=14, fontweight='bold')
 
     if output_path:
-        plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
+        plt.savefig(output_path, dpi=GRID_DPI, bbox_inches='tight', facecolor='white')
         print(f"저장됨: {output_path}")
     else:
         plt.show()
@@ -355,12 +494,19 @@ def main():
     parser.add_argument("input", help="JSON 파일 또는 디렉토리")
     parser.add_argument("-o", "--output", help="출력 이미지 파일")
     parser.add_argument("--grid", action="store_true", help="그리드 뷰")
+    parser.add_argument("--workers", type=int, default=1, help="그리드 셀 병렬 렌더링 프로세스 수")
     args = parser.parse_args()
 
     input_path = Path(args.input)
+    grid = input_path.is_dir() or args.grid
+
+    # 파일로만 저장할 때는 GUI 백엔드 초기화 비용이 없는 Agg 사용
+    # (그리드 뷰를 -o 없이 실행하면 plt.show()가 필요하므로 기존 백엔드 유지)
+    if not grid or args.output:
+        plt.switch_backend("Agg")
 
-    if input_path.is_dir() or args.grid:
-        visualize_grid(input_path, args.output)
+    if grid:
+        visualize_grid(input_path, args.output, n_workers=args.workers)
     else:
         visualize_single(input_path, args.output)
 